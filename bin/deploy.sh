@@ -46,13 +46,18 @@ echo ""
 mkdir -p "$SNEK_BIN_DIR"
 rm -rf "$BUNDLE_DIR"
 
+# Bundle taskpy together with its dependencies so the wrapper can run with
+# python -S: skipping site.py (and the site-packages scan it triggers) trims
+# interpreter start-up on every invocation
 echo "📦 Building bundled site-packages at $BUNDLE_DIR"
-"${PIP_CMD[@]}" install --upgrade --no-deps --target "$BUNDLE_DIR" "$ROOT_DIR"
+"${PIP_CMD[@]}" install --upgrade --target "$BUNDLE_DIR" "$ROOT_DIR"
 
 echo "📦 Creating taskpy wrapper in snek directory..."
 TASKPY_TARGET="$SNEK_BIN_DIR/taskpy"
+# env -S splits the shebang line so -S reaches python3; resolving through
+# PATH keeps the wrapper working when the interpreter moves or is upgraded
 cat > "$TASKPY_TARGET" << WRAPPER_EOF
-#!/usr/bin/env python3
+#!/usr/bin/env -S python3 -S
 import os
 import sys
 
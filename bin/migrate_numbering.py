@@ -4,9 +4,12 @@ Migrate task files from 3-digit format (EPIC-001) to 2-digit format (EPIC-01).
 This is a one-time migration script.
 """
 
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import List
 
 # Add src to path
 ROOT_DIR = Path(__file__).parent.parent
@@ -14,23 +17,37 @@ sys.path.insert(0, str(ROOT_DIR / "src"))
 
 from taskpy.storage import TaskStorage
 
+# Task ID as it appears in filenames (e.g., FEAT-001)
+TASK_ID_RE = re.compile(r'^([A-Z]+)-(\d+)$')
+
+# Filenames already in the target format (EPIC-01, or EPIC-100 and up)
+_NEW_FORMAT = re.compile(r'^[A-Z]+-(?:\d{2}|[1-9]\d{2,})\.md$')
+
+
+def migrate_task_file(path_str: str):
+    """
+    Migrate a single task file from 3-digit to 2-digit format.
+
+    Self-contained (takes a path string, touches only that file) so it can
+    run in a worker process.
+
+    Returns:
+        Tuple of (migrated, message) for the parent to report in order
+    """
+    file_path = Path(path_str)
 
-def migrate_task_file(file_path: Path, storage: TaskStorage):
-    """Migrate a single task file from 3-digit to 2-digit format."""
     # Parse the old task ID from filename
     old_id = file_path.stem  # e.g., "FEAT-001"
-    match = re.match(r'^([A-Z]+)-(\d+)$', old_id)
+    match = TASK_ID_RE.match(old_id)
     if not match:
-        print(f"⚠️  Skipping {file_path.name} - invalid format")
-        return False
+        return False, f"⚠️  Skipping {file_path.name} - invalid format"
 
     epic, num_str = match.groups()
     num = int(num_str)
 
     # If already 2-digit format, skip
     if num < 100 and len(num_str) == 2:
-        print(f"✓ {old_id} already in 2-digit format")
-        return False
+        return False, f"✓ {old_id} already in 2-digit format"
 
     # Generate new ID
     if num <= 99:
@@ -39,62 +56,38 @@ def migrate_task_file(file_path: Path, storage: TaskStorage):
         new_id = f"{epic}-{num:03d}"  # Already correct for 100+
 
     if new_id == old_id:
-        print(f"✓ {old_id} already correct")
-        return False
-
-    # Read the file content
-    content = file_path.read_text()
-
-    # Update the ID in frontmatter
-    content = re.sub(
-        r"^id:\s*" + re.escape(old_id),
-        f"id: {new_id}",
-        content,
-        flags=re.MULTILINE
-    )
+        return False, f"✓ {old_id} already correct"
 
-    # Update the ID in the heading (if present)
-    content = re.sub(
-        r"^#\s+" + re.escape(old_id),
-        f"# {new_id}",
-        content,
-        flags=re.MULTILINE
-    )
+    # Work on raw bytes; task files are UTF-8 and IDs are ASCII, so there
+    # is no need to decode and re-encode the whole file
+    content = file_path.read_bytes()
 
-    # Create new file path
-    new_path = file_path.parent / f"{new_id}.md"
+    # Update the ID in frontmatter and heading (if present) in one scan
+    id_re = re.compile(rb"^(?:(id:)\s*|(#)\s+)" + re.escape(old_id.encode()), re.MULTILINE)
+    new_id_bytes = new_id.encode()
+    content = id_re.sub(lambda m: (m.group(1) or m.group(2)) + b" " + new_id_bytes, content)
 
-    # Write new file
-    new_path.write_text(content)
-
-    # Remove old file
-    file_path.unlink()
+    # Write beside the destination and swap it in atomically, so an
+    # interrupted run never leaves a truncated task file behind
+    new_path = file_path.parent / f"{new_id}.md"
+    tmp_path = new_path.with_suffix(".md.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, new_path)
+    if new_path != file_path:
+        file_path.unlink()
 
-    print(f"✓ Migrated: {old_id} -> {new_id}")
-    return True
+    return True, f"✓ Migrated: {old_id} -> {new_id}"
 
 
-def rebuild_manifest(storage: TaskStorage):
+def rebuild_manifest(storage: TaskStorage, status_dirs: List[Path]):
     """Rebuild the manifest from scratch."""
     print("\n📝 Rebuilding manifest...")
 
-    # Clear manifest
-    storage.manifest_file.write_text("")
-    storage._create_manifest_header()
-
-    # Scan all task files and rebuild
-    count = 0
-    for status_dir in storage.status_dir.iterdir():
-        if not status_dir.is_dir():
-            continue
-
-        for task_file in status_dir.glob("*.md"):
-            try:
-                task = storage.read_task_file(task_file)
-                storage._update_manifest_row(task)
-                count += 1
-            except Exception as e:
-                print(f"⚠️  Error processing {task_file.name}: {e}")
+    count = storage.rebuild_manifest_from_disk(
+        paths=[task_file for status_dir in status_dirs for task_file in sorted(status_dir.glob("*.md"))],
+        on_error=lambda task_file, e: print(f"⚠️  Error processing {task_file.name}: {e}"),
+        workers=32,
+    )
 
     print(f"✓ Rebuilt manifest with {count} tasks")
 
@@ -112,23 +105,33 @@ def main():
     print("║     3-digit (EPIC-001) -> 2-digit (EPIC-01)   ║")
     print("╚════════════════════════════════════════════════╝\n")
 
+    # List status directories once; the manifest rebuild reuses the listing
+    status_dirs = [d for d in storage.status_dir.iterdir() if d.is_dir()]
+
     # Find all task files
-    task_files = []
-    for status_dir in storage.status_dir.iterdir():
-        if not status_dir.is_dir():
-            continue
-        task_files.extend(status_dir.glob("*.md"))
+    task_files = [task_file for status_dir in status_dirs for task_file in status_dir.glob("*.md")]
+
+    print(f"Found {len(task_files)} task files")
 
-    print(f"Found {len(task_files)} task files\n")
+    # Skip files that already conform without reading or dispatching them
+    pending = [task_file for task_file in task_files if not _NEW_FORMAT.match(task_file.name)]
+    print(f"Skipping {len(task_files) - len(pending)} already in the new format\n")
 
-    # Migrate each file
+    # Migrate files in parallel; report results in sorted order
     migrated = 0
-    for task_file in sorted(task_files):
-        if migrate_task_file(task_file, storage):
-            migrated += 1
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(
+            migrate_task_file,
+            [str(task_file) for task_file in sorted(pending)],
+            chunksize=16,
+        )
+        for was_migrated, message in results:
+            print(message)
+            if was_migrated:
+                migrated += 1
 
     # Rebuild manifest
-    rebuild_manifest(storage)
+    rebuild_manifest(storage, status_dirs)
 
     print(f"\n✅ Migration complete! Migrated {migrated} tasks.")
 
@@ -9,9 +9,11 @@ Changes:
 - Migrate existing backlog tasks based on completeness
 """
 
+import os
 import re
 import sys
 from pathlib import Path
+from typing import Dict, List
 
 # Add src to path
 ROOT_DIR = Path(__file__).parent.parent
@@ -19,6 +21,24 @@ sys.path.insert(0, str(ROOT_DIR / "src"))
 
 from taskpy.storage import TaskStorage
 
+# Either template acceptance-criteria placeholder, matched in one scan
+_CRIT_RE = re.compile(rb"- \[ \] Criterion [12]")
+
+
+def _replace_status_line(content: bytes, old: bytes, new: bytes) -> bytes:
+    """
+    Rewrite a `status: <old>` frontmatter line to `status: <new>`.
+
+    A plain line scan with startswith() instead of a MULTILINE regex; the
+    match is a literal, so the regex engine only adds overhead. Works on
+    raw bytes so files are never decoded.
+    """
+    lines = content.splitlines(keepends=True)
+    for i, line in enumerate(lines):
+        if line.startswith(b"status:") and line[7:].strip() == old:
+            lines[i] = b"status: " + new + line[len(line.rstrip(b"\r\n")):]
+    return b"".join(lines)
+
 
 def ensure_new_directories(storage: TaskStorage):
     """Ensure all new status directories exist."""
@@ -28,47 +48,60 @@ def ensure_new_directories(storage: TaskStorage):
     print("✓ Created new status directories (stub/, qa/, blocked/)")
 
 
-def migrate_review_to_qa(storage: TaskStorage):
+def scan_task_files(storage: TaskStorage) -> Dict[str, List[Path]]:
+    """
+    List task files in every status directory with a single scandir pass.
+
+    The phases below share this listing (and keep it current as they move
+    files) instead of re-globbing the status directories each time.
+    """
+    task_files = {}
+    with os.scandir(storage.status_dir) as status_entries:
+        for status_entry in status_entries:
+            if not status_entry.is_dir():
+                continue
+            with os.scandir(status_entry.path) as entries:
+                task_files[status_entry.name] = [
+                    Path(entry.path) for entry in entries if entry.name.endswith(".md")
+                ]
+    return task_files
+
+
+def migrate_review_to_qa(storage: TaskStorage, task_files: Dict[str, List[Path]]):
     """Migrate tasks from review/ to qa/ directory."""
     review_dir = storage.status_dir / "review"
     qa_dir = storage.status_dir / "qa"
 
-    if not review_dir.exists():
+    review_files = task_files.pop("review", None)
+    if review_files is None:
         print("✓ No review/ directory found (already migrated or clean install)")
         return 0
 
+    qa_files = task_files.setdefault("qa", [])
     migrated = 0
-    for task_file in review_dir.glob("*.md"):
-        # Read content
-        content = task_file.read_text()
-
-        # Update status in frontmatter
-        content = re.sub(
-            r"^status:\s*review\s*$",
-            "status: qa",
-            content,
-            flags=re.MULTILINE
-        )
-
-        # Write to new location
+    for task_file in review_files:
+        # Move first (metadata only), then rewrite once in the new location
         new_path = qa_dir / task_file.name
-        new_path.write_text(content)
+        os.replace(task_file, new_path)
+        content = new_path.read_bytes()
 
-        # Remove old file
-        task_file.unlink()
+        # Update status in frontmatter
+        content = _replace_status_line(content, b"review", b"qa")
+        new_path.write_bytes(content)
+        qa_files.append(new_path)
 
         print(f"✓ Migrated {task_file.name}: review → qa")
         migrated += 1
 
     # Remove empty review directory
-    if review_dir.exists() and not list(review_dir.iterdir()):
+    if not any(review_dir.iterdir()):
         review_dir.rmdir()
         print("✓ Removed empty review/ directory")
 
     return migrated
 
 
-def assess_backlog_tasks(storage: TaskStorage):
+def assess_backlog_tasks(storage: TaskStorage, task_files: Dict[str, List[Path]]):
     """
     Assess backlog tasks to see if they should be stub status.
     A task is incomplete (stub) if it has placeholder content.
@@ -78,34 +111,33 @@ def assess_backlog_tasks(storage: TaskStorage):
 
     # Ensure stub directory exists
     stub_dir.mkdir(exist_ok=True)
+    stub_files = task_files.setdefault("stub", [])
 
-    if not backlog_dir.exists():
+    backlog_files = task_files.get("backlog")
+    if backlog_files is None:
         print("✓ No backlog/ directory found")
         return 0
 
     moved_to_stub = 0
-    for task_file in backlog_dir.glob("*.md"):
-        content = task_file.read_text()
+    for task_file in list(backlog_files):
+        content = task_file.read_bytes()
 
-        # Check if task has placeholder content
-        has_placeholder_desc = "<!-- Add task description here -->" in content
-        has_placeholder_criteria = "- [ ] Criterion 1" in content or "- [ ] Criterion 2" in content
-        has_minimal_desc = content.count("\n") < 30  # Very short file
+        # Groomed tasks lack the description placeholder; skip them before
+        # scanning for the criteria placeholders
+        if b"<!-- Add task description here -->" not in content:
+            continue
 
-        # If it has placeholders, it's incomplete
-        if has_placeholder_desc and has_placeholder_criteria:
+        # If it also has placeholder criteria, it's incomplete
+        if _CRIT_RE.search(content):
             # Update status
-            content = re.sub(
-                r"^status:\s*backlog\s*$",
-                "status: stub",
-                content,
-                flags=re.MULTILINE
-            )
-
-            # Move to stub directory
+            content = _replace_status_line(content, b"backlog", b"stub")
+
+            # Move to stub directory, then rewrite once in place
             new_path = stub_dir / task_file.name
-            new_path.write_text(content)
-            task_file.unlink()
+            os.replace(task_file, new_path)
+            new_path.write_bytes(content)
+            backlog_files.remove(task_file)
+            stub_files.append(new_path)
 
             print(f"✓ Moved {task_file.name} to stub (incomplete)")
             moved_to_stub += 1
@@ -113,27 +145,15 @@ def assess_backlog_tasks(storage: TaskStorage):
     return moved_to_stub
 
 
-def rebuild_manifest(storage: TaskStorage):
+def rebuild_manifest(storage: TaskStorage, task_files: Dict[str, List[Path]]):
     """Rebuild manifest from all task files."""
     print("\n📝 Rebuilding manifest...")
 
-    # Clear and recreate manifest with new headers
-    storage.manifest_file.write_text("")
-    storage._create_manifest_header()
-
-    # Scan all tasks and rebuild
-    count = 0
-    for status_dir in storage.status_dir.iterdir():
-        if not status_dir.is_dir():
-            continue
-
-        for task_file in status_dir.glob("*.md"):
-            try:
-                task = storage.read_task_file(task_file)
-                storage._update_manifest_row(task)
-                count += 1
-            except Exception as e:
-                print(f"⚠️  Error processing {task_file.name}: {e}")
+    count = storage.rebuild_manifest_from_disk(
+        paths=[task_file for files in task_files.values() for task_file in files],
+        on_error=lambda task_file, e: print(f"⚠️  Error processing {task_file.name}: {e}"),
+        workers=32,
+    )
 
     print(f"✓ Rebuilt manifest with {count} tasks")
 
@@ -154,15 +174,18 @@ def main():
     # Ensure new directories exist
     ensure_new_directories(storage)
 
+    # List task files once; each phase updates the listing as it moves files
+    task_files = scan_task_files(storage)
+
     # Migrate review to qa
-    review_migrated = migrate_review_to_qa(storage)
+    review_migrated = migrate_review_to_qa(storage, task_files)
 
     # Assess backlog for incomplete tasks
     print("\n🔍 Assessing backlog tasks for completeness...")
-    stub_count = assess_backlog_tasks(storage)
+    stub_count = assess_backlog_tasks(storage, task_files)
 
     # Rebuild manifest
-    rebuild_manifest(storage)
+    rebuild_manifest(storage, task_files)
 
     print(f"\n✅ Migration complete!")
     print(f"   - {review_migrated} tasks migrated from review → qa")
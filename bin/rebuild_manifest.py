@@ -12,8 +12,7 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from taskpy.storage import TaskStorage
-from taskpy.models import TaskStatus
+from taskpy.legacy.storage import TaskStorage
 
 def main():
     """Rebuild the manifest from all task files."""
@@ -25,24 +24,11 @@ def main():
 
     print("Rebuilding manifest from task files...")
 
-    # Clear manifest (keep header)
-    storage._create_manifest_header()
-
-    # Scan all status directories
-    tasks_found = 0
-    for status in TaskStatus:
-        status_dir = storage.status_dir / status.value
-        if not status_dir.exists():
-            continue
-
-        for task_file in status_dir.glob("*.md"):
-            try:
-                task = storage.read_task_file(task_file)
-                storage._update_manifest_row(task)
-                tasks_found += 1
-                print(f"  Added {task.id} ({status.value})")
-            except Exception as e:
-                print(f"  Error reading {task_file}: {e}")
+    tasks_found = storage.rebuild_manifest_from_disk(
+        on_error=lambda task_file, e: print(f"  Error reading {task_file}: {e}"),
+        on_task=lambda task: print(f"  Added {task.id} ({task.status.value})"),
+        workers=32,
+    )
 
     print(f"\n✓ Rebuilt manifest with {tasks_found} tasks")
 
@@ -6,14 +6,16 @@ This script assigns auto_id values to tasks that don't have them,
 using their creation timestamp for chronological ordering.
 """
 
+import os
 import sys
+from datetime import datetime
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from taskpy.storage import TaskStorage
-from taskpy.models import TaskStatus
+from taskpy.legacy.storage import TaskStorage
+from taskpy.legacy.models import TaskStatus
 
 def main():
     """Backfill auto_id for all existing tasks."""
@@ -24,17 +26,35 @@ def main():
         print("Error: TaskPy not initialized")
         sys.exit(1)
 
-    # Collect all tasks across all statuses
+    # Handle both timezone-aware and naive datetimes
+    def get_sort_key(metadata):
+        created = datetime.fromisoformat(str(metadata['created']))
+        # Convert naive datetime to comparable timestamp
+        if created.tzinfo is None:
+            return created.timestamp()
+        else:
+            return created.timestamp()
+
+    # Collect frontmatter for all tasks across all statuses; full task files
+    # are only loaded for the ones that need an auto_id. Tasks whose
+    # frontmatter or created timestamp cannot be read are skipped here,
+    # before any file is rewritten
     all_tasks = []
     for status in TaskStatus:
         status_dir = storage.status_dir / status.value
         if not status_dir.exists():
             continue
 
-        for task_file in sorted(status_dir.glob('*.md')):
+        # scandir yields names from a single readdir pass, no per-entry stat
+        with os.scandir(status_dir) as it:
+            entries = [entry for entry in it if entry.name.endswith('.md')]
+        entries.sort(key=lambda entry: entry.name)
+
+        for entry in entries:
+            task_file = Path(entry.path)
             try:
-                task = storage.read_task_file(task_file)
-                all_tasks.append((task, task_file))
+                metadata = storage.read_task_frontmatter(task_file)
+                all_tasks.append((get_sort_key(metadata), metadata, task_file))
             except Exception as e:
                 print(f"Warning: Failed to read {task_file}: {e}")
 
@@ -43,36 +63,37 @@ def main():
         return
 
     # Sort by created timestamp (chronological order)
-    # Handle both timezone-aware and naive datetimes
-    def get_sort_key(task_tuple):
-        task = task_tuple[0]
-        created = task.created
-        # Convert naive datetime to comparable timestamp
-        if created.tzinfo is None:
-            return created.timestamp()
-        else:
-            return created.timestamp()
-
-    all_tasks.sort(key=get_sort_key)
+    all_tasks.sort(key=lambda task_tuple: task_tuple[0])
 
     # Assign auto_id in chronological order
     next_auto_id = 1
     updated_count = 0
+    failed_count = 0
 
-    for task, task_file in all_tasks:
-        if task.auto_id is None:
-            task.auto_id = next_auto_id
-            storage.write_task_file(task)
-            print(f"✓ {task.id}: auto_id={next_auto_id}")
-            updated_count += 1
+    for _, metadata, task_file in all_tasks:
+        if metadata.get('auto_id') is None:
+            try:
+                task = storage.read_task_file(task_file)
+                task.auto_id = next_auto_id
+                storage.write_task_file(task)
+            except Exception as e:
+                # The task keeps its slot, so a rerun after fixing the file
+                # gives it the same auto_id
+                print(f"Warning: Failed to update {task_file}: {e}")
+                failed_count += 1
+            else:
+                print(f"✓ {task.id}: auto_id={next_auto_id}")
+                updated_count += 1
         else:
-            print(f"- {task.id}: already has auto_id={task.auto_id}")
+            print(f"- {metadata.get('id', task_file.stem)}: already has auto_id={metadata['auto_id']}")
         next_auto_id += 1
 
     # Update sequence counter to next value
     storage.sequence_file.write_text(f"{next_auto_id}\n")
 
     print(f"\n✓ Backfilled {updated_count} tasks")
+    if failed_count:
+        print(f"Warning: {failed_count} tasks could not be updated")
     print(f"✓ Sequence counter set to {next_auto_id}")
     print(f"\nRun: taskpy manifest rebuild")
 
@@ -21,7 +21,6 @@ Key features:
 """
 
 import sys
-import importlib.metadata
 
 
 def get_version() -> str:
@@ -31,6 +30,9 @@ def get_version() -> str:
     Returns:
         Version string (e.g., "0.1.0")
     """
+    # importlib.metadata is slow to import; only pay for it when asked
+    import importlib.metadata
+
     try:
         return importlib.metadata.version("taskpy")
     except importlib.metadata.PackageNotFoundError:
@@ -38,7 +40,15 @@ def get_version() -> str:
         return "0.1.0-dev"
 
 
-__version__ = get_version()
+def __getattr__(name: str):
+    """Resolve __version__ on first access (PEP 562) and cache it."""
+    if name == "__version__":
+        version = get_version()
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __author__ = "snekfx"
 
 # Package metadata
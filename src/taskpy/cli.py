@@ -8,11 +8,9 @@ still needs the old CLI surface.
 
 from __future__ import annotations
 
+import functools
+import os
 import sys
-from pathlib import Path
-
-from taskpy import __version__
-from taskpy.modern import cli as modern_cli
 
 VERSION_FLAGS = {"-v", "--version"}
 
@@ -60,18 +58,31 @@ def _normalize_legacy_flags(args: list[str]) -> list[str]:
     return normalized
 
 
-def _print_version():
-    """Display logo + version info."""
-    logo_path = Path(__file__).parent / "logo.txt"
+@functools.lru_cache(maxsize=1)
+def read_logo() -> str:
+    """Read the logo shipped as taskpy package data (empty if missing)."""
+    import taskpy
+
+    # Go through the package's own loader, which also reads from zipped
+    # installs; importlib.resources does the same but takes ~20 ms to import
+    path = os.path.join(os.path.dirname(taskpy.__file__), "logo.txt")
     try:
-        logo = logo_path.read_text().rstrip()
-        if logo:
-            print(logo)
+        return taskpy.__spec__.loader.get_data(path).decode("utf-8").rstrip()
     except OSError:
-        pass
+        return ""
+
 
-    print(f"Version: {__version__} | License: AGPLv3")
-    print("Copyright © 2025 Qodeninja/SnekFX")
+def _print_version():
+    """Display logo + version info."""
+    from taskpy import __version__
+
+    banner = (
+        f"Version: {__version__} | License: AGPLv3\n"
+        "Copyright © 2025 Qodeninja/SnekFX\n"
+    )
+    logo = read_logo()
+    # One write for the whole block rather than a print() per line
+    sys.stdout.write(f"{logo}\n{banner}" if logo else banner)
 
 
 def main(argv: list[str] | None = None):
@@ -86,10 +97,19 @@ def main(argv: list[str] | None = None):
     args = _normalize_legacy_flags(list(argv))
 
     if args and args[0] == "modern":
-        print("`taskpy modern …` has been removed. Use `taskpy …` directly.", file=sys.stderr)
+        sys.stderr.write("`taskpy modern …` has been removed. Use `taskpy …` directly.\n")
         sys.exit(2)
 
-    modern_cli.main(args)
+    # Loading the feature modules is the bulk of start-up; --version above
+    # returns without it. Ctrl-C while they load or while the command runs
+    # exits quietly instead of with a traceback
+    try:
+        from taskpy.modern import cli as modern_cli
+
+        modern_cli.main(args)
+    except KeyboardInterrupt:
+        sys.stderr.write("\nInterrupted\n")
+        sys.exit(130)
 
 
-__all__ = ["main"]
+__all__ = ["main", "read_logo"]
@@ -4,30 +4,54 @@ CLI interface for TaskPy.
 Command-line argument parsing and command routing.
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
 import sys
-from pathlib import Path
 
 from taskpy import __version__
-from taskpy.legacy.output import OutputMode, set_output_mode
+from taskpy.cli import read_logo
+
+# Bound once; the flag tables below use it for every hidden default
+_SUPPRESS = argparse.SUPPRESS
+
+_VERSION_BANNER = (
+    f"Version: {__version__} | License: AGPLv3\n"
+    "Copyright © 2025 Qodeninja/SnekFX"
+)
+
+
+def render_help_banner() -> str:
+    """Logo (or the bare name if the logo is missing) and version banner for help output."""
+    return f"{read_logo() or 'TaskPy'}\n{_VERSION_BANNER}"
+
+
+@functools.lru_cache(maxsize=1)
+def _banner_bytes() -> bytes:
+    """Logo plus version banner, encoded once for direct writes."""
+    logo = read_logo()
+    banner = f"{logo}\n{_VERSION_BANNER}\n" if logo else f"{_VERSION_BANNER}\n"
+    return banner.encode("utf-8")
+
+
+def _print_banner() -> None:
+    """Write the logo and version banner straight to the stdout buffer."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (tests, redirect_stdout)
+        sys.stdout.write(_banner_bytes().decode("utf-8"))
+        return
+    sys.stdout.flush()
+    buffer.write(_banner_bytes())
+    buffer.flush()
 
 
 class VersionAction(argparse.Action):
     """Custom version action that displays logo and version info."""
 
     def __call__(self, parser, namespace, values, option_string=None):
-        # Read logo from package directory (bundled with the package)
-        logo_path = Path(__file__).parent / "logo.txt"
-        try:
-            with open(logo_path, "r") as f:
-                logo = f.read().rstrip()
-            print(logo)
-        except Exception:
-            # Fallback if logo not found
-            pass
-
-        print(f"Version: {__version__} | License: AGPLv3")
-        print("Copyright © 2025 Qodeninja/SnekFX")
+        _print_banner()
         parser.exit()
 
 
@@ -36,16 +60,7 @@ class HelpAction(argparse.Action):
 
     def __call__(self, parser, namespace, values, option_string=None):
         # Display logo and version
-        logo_path = Path(__file__).parent / "logo.txt"
-        try:
-            with open(logo_path, "r") as f:
-                logo = f.read().rstrip()
-            print(logo)
-        except Exception:
-            pass
-
-        print(f"Version: {__version__} | License: AGPLv3")
-        print("Copyright © 2025 Qodeninja/SnekFX")
+        _print_banner()
         print()
 
         # Display help
@@ -53,83 +68,118 @@ class HelpAction(argparse.Action):
         parser.exit()
 
 
-def _create_global_parser() -> argparse.ArgumentParser:
-    """
-    Create parser with options shared between root parser and subcommands.
-
-    This allows flags to work in both positions:
-    - taskpy --agent list
-    - taskpy list --agent
-    """
-    global_parser = argparse.ArgumentParser(add_help=False)
-
-    global_parser.add_argument(
-        "-v", "--version",
+# argparse choices, shared as immutable tuples across subparsers
+_VIEW_CHOICES = ("pretty", "data")
+_INIT_TYPE_CHOICES = ("rust", "python", "node", "shell", "generic")
+_PRIORITY_CHOICES = ("critical", "high", "medium", "low")
+_CREATE_STATUS_CHOICES = ("stub", "backlog", "ready", "active", "qa", "blocked")
+_LIST_FORMAT_CHOICES = ("table", "cards", "ids", "tsv")
+_SORT_CHOICES = ("priority", "created", "id", "status")
+_MOVE_STATUS_CHOICES = ("stub", "backlog", "ready", "active", "qa", "regression", "done", "archived", "blocked")
+_RESOLUTION_CHOICES = ("fixed", "duplicate", "cannot_reproduce", "wont_fix", "config_change", "docs_only")
+_HELP_TOPIC_CHOICES = ("dev", "stub", "active", "regression")
+
+# Options shared between the root parser and every subcommand, as
+# (flags, kwargs) pairs for add_argument()
+_GLOBAL_FLAG_SPECS = (
+    (("-v", "--version"), dict(
         action=VersionAction,
         nargs=0,
-        default=argparse.SUPPRESS,
+        default=_SUPPRESS,
         help="Show version and logo"
-    )
-
-    global_parser.add_argument(
-        "--view",
-        choices=["pretty", "data"],
-        default=argparse.SUPPRESS,
+    )),
+    (("--view",), dict(
+        choices=_VIEW_CHOICES,
+        default=_SUPPRESS,
         help="Output mode: pretty (boxy) or data (plain)"
-    )
-
-    global_parser.add_argument(
-        "--data",
+    )),
+    (("--data",), dict(
         action="store_true",
-        default=argparse.SUPPRESS,
+        default=_SUPPRESS,
         help="Plain data output (same as --view=data)"
-    )
-
-    global_parser.add_argument(
-        "--no-boxy",
+    )),
+    (("--no-boxy",), dict(
         action="store_true",
-        default=argparse.SUPPRESS,
+        default=_SUPPRESS,
         help="Disable boxy output (same as --view=data)"
-    )
-
-    global_parser.add_argument(
-        "--agent",
+    )),
+    (("--agent",), dict(
         action="store_true",
-        default=argparse.SUPPRESS,
+        default=_SUPPRESS,
         help="Agent-friendly output (same as --view=data)"
-    )
-
-    global_parser.add_argument(
-        "--all",
+    )),
+    (("--all",), dict(
         action="store_true",
-        default=argparse.SUPPRESS,
+        default=_SUPPRESS,
         help="Show all items including done/archived (for list/history commands)"
-    )
+    )),
+)
+
+
+def _add_global_flags(parser: argparse.ArgumentParser) -> None:
+    """
+    Attach the options shared between root parser and subcommands.
 
-    return global_parser
+    This allows flags to work in both positions:
+    - taskpy --agent list
+    - taskpy list --agent
+
+    Adding them straight from _GLOBAL_FLAG_SPECS avoids argparse's
+    parents= machinery, which copies every action into each child parser.
+    """
+    for flags, kwargs in _GLOBAL_FLAG_SPECS:
+        parser.add_argument(*flags, **kwargs)
+
+
+# Global flags that may precede the subcommand (see _GLOBAL_FLAG_SPECS)
+_GLOBAL_SWITCHES = frozenset({"--data", "--no-boxy", "--agent", "--all"})
+
+
+def _first_command_token(argv: list) -> str | None:
+    """Return the first token after any leading global flags, if there is one."""
+    args = iter(argv)
+    for token in args:
+        if token in _GLOBAL_SWITCHES or token.startswith("--view="):
+            continue
+        if token == "--view":
+            next(args, None)
+            continue
+        return token
+    return None
+
+
+@functools.lru_cache(maxsize=1)
+def _command_handlers() -> dict:
+    """Map each subcommand name to its cmd_<name> handler."""
+    # Import commands module (legacy)
+    from taskpy.legacy import commands
+
+    return {
+        name[len("cmd_"):]: handler
+        for name, handler in vars(commands).items()
+        if name.startswith("cmd_") and callable(handler)
+    }
 
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the main argument parser."""
     from taskpy.legacy.help import MAIN_EPILOG, COMMAND_HELP
 
-    global_parser = _create_global_parser()
-
     parser = argparse.ArgumentParser(
         prog="taskpy",
         description="File-based agile task management for META PROCESS v4",
         epilog=MAIN_EPILOG,
-        parents=[global_parser],
         add_help=False,  # We'll add custom help action
         formatter_class=argparse.RawDescriptionHelpFormatter
     )
+    _add_global_flags(parser)
 
     # Add custom help action
     parser.add_argument(
         "-h", "--help",
         action=HelpAction,
         nargs=0,
-        default=argparse.SUPPRESS,
+        default=_SUPPRESS,
         help="Show this help message and exit"
     )
 
@@ -141,12 +191,9 @@ def create_parser() -> argparse.ArgumentParser:
         # Use command help from help.py if available
         if 'help' not in kwargs and name in COMMAND_HELP:
             kwargs['help'] = COMMAND_HELP[name]
-        return subparsers.add_parser(
-            name,
-            parents=[global_parser],
-            add_help=True,
-            **kwargs
-        )
+        sub = subparsers.add_parser(name, add_help=True, **kwargs)
+        _add_global_flags(sub)
+        return sub
 
     # taskpy init
     init_parser = add_subparser("init")
@@ -157,7 +204,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     init_parser.add_argument(
         "--type",
-        choices=["rust", "python", "node", "shell", "generic"],
+        choices=_INIT_TYPE_CHOICES,
         help="Explicitly set project type (default: auto-detect)"
     )
 
@@ -184,13 +231,13 @@ def create_parser() -> argparse.ArgumentParser:
     )
     create_parser.add_argument(
         "--priority",
-        choices=["critical", "high", "medium", "low"],
+        choices=_PRIORITY_CHOICES,
         default="medium",
         help="Task priority"
     )
     create_parser.add_argument(
         "--status",
-        choices=["stub", "backlog", "ready", "active", "qa", "blocked"],
+        choices=_CREATE_STATUS_CHOICES,
         default="stub",
         help="Initial status (default: stub for incomplete tasks)"
     )
@@ -253,24 +300,24 @@ def create_parser() -> argparse.ArgumentParser:
     )
     list_parser.add_argument(
         "--format",
-        choices=["table", "cards", "ids", "tsv"],
+        choices=_LIST_FORMAT_CHOICES,
         default="table",
         help="Output format"
     )
     list_parser.add_argument(
         "--sort",
-        choices=["priority", "created", "id", "status"],
+        choices=_SORT_CHOICES,
         default="priority",
         help="Sort order: priority (default), created (chronological), id (task ID), status (workflow stage)"
     )
-    # Note: --all is now a global flag, defined in global_parser
+    # Note: --all is now a global flag, defined in _GLOBAL_FLAG_SPECS
     # Keep --show-all as alias for backward compatibility
     list_parser.add_argument(
         "--show-all",
         dest="all",
         action="store_true",
-        default=argparse.SUPPRESS,
-        help=argparse.SUPPRESS  # Hidden alias
+        default=_SUPPRESS,
+        help=_SUPPRESS  # Hidden alias
     )
 
     # taskpy show <TASK-ID>
@@ -402,7 +449,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     move_parser.add_argument(
         "status",
-        choices=["stub", "backlog", "ready", "active", "qa", "regression", "done", "archived", "blocked"],
+        choices=_MOVE_STATUS_CHOICES,
         help="Target status"
     )
     move_parser.add_argument(
@@ -422,7 +469,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     kanban_parser.add_argument(
         "--sort",
-        choices=["priority", "created", "id", "status"],
+        choices=_SORT_CHOICES,
         default="priority",
         help="Sort order: priority (default), created (chronological), id (task ID), status (workflow stage)"
     )
@@ -559,7 +606,7 @@ def create_parser() -> argparse.ArgumentParser:
         nargs="?",
         help="Task ID (e.g., FEAT-01) - omit to show all with --all"
     )
-    # Note: --all is now a global flag, defined in global_parser
+    # Note: --all is now a global flag, defined in _GLOBAL_FLAG_SPECS
 
     # taskpy resolve <TASK-ID> --resolution TYPE --reason REASON
     resolve_parser = add_subparser(
@@ -573,7 +620,7 @@ def create_parser() -> argparse.ArgumentParser:
     resolve_parser.add_argument(
         "--resolution",
         required=True,
-        choices=["fixed", "duplicate", "cannot_reproduce", "wont_fix", "config_change", "docs_only"],
+        choices=_RESOLUTION_CHOICES,
         help="Resolution type"
     )
     resolve_parser.add_argument(
@@ -668,7 +715,7 @@ def create_parser() -> argparse.ArgumentParser:
         "topic",
         nargs="?",
         default=None,
-        choices=["dev", "stub", "active", "regression"],
+        choices=_HELP_TOPIC_CHOICES,
         help="Workflow help topic (dev, stub, active, regression)"
     )
 
@@ -781,52 +828,63 @@ def main():
         modern_cli.main()
         return
 
+    # Answer `taskpy --version` before any parser is built
+    if _first_command_token(sys.argv[1:]) in ("-v", "--version"):
+        _print_banner()
+        sys.exit(0)
+
+    from taskpy.legacy.output import OutputMode, set_output_mode
+
     parser = create_parser()
     args = parser.parse_args()
 
     # Handle output mode (allow global flags anywhere)
-    view_mode = getattr(args, "view", "pretty")
-    data_flag = getattr(args, "data", False)
-    no_boxy_flag = getattr(args, "no_boxy", False)
-    agent_flag = getattr(args, "agent", False)
+    flags = vars(args)
+    view_mode = flags.get("view", "pretty")
+    data_flag = flags.get("data", False)
+    no_boxy_flag = flags.get("no_boxy", False)
+    agent_flag = flags.get("agent", False)
 
     # Normalize namespace so downstream handlers can rely on attributes
-    args.view = view_mode
-    args.data = data_flag
-    args.no_boxy = no_boxy_flag
-    args.agent = agent_flag
+    flags.update(view=view_mode, data=data_flag, no_boxy=no_boxy_flag, agent=agent_flag)
 
     if agent_flag:
-        set_output_mode(OutputMode.AGENT)
+        mode = OutputMode.AGENT
     elif data_flag or no_boxy_flag or view_mode == "data":
-        set_output_mode(OutputMode.DATA)
+        mode = OutputMode.DATA
     else:
-        set_output_mode(OutputMode.PRETTY)
+        mode = OutputMode.PRETTY
+    set_output_mode(mode)
 
     # Route to command handlers
     if not args.command:
         parser.print_help()
         sys.exit(0)
 
-    # Import commands module (legacy)
-    from taskpy.legacy import commands
-
     # Find and execute command
     command_name = args.command
-    handler = getattr(commands, f"cmd_{command_name}", None)
+    # Loading the commands module is slow too, so Ctrl-C during the import
+    # gets the same clean exit as Ctrl-C in the handler
+    try:
+        handler = _command_handlers().get(command_name)
 
-    if handler is None:
-        print(f"Error: Command '{command_name}' not implemented yet")
-        sys.exit(1)
+        if handler is None:
+            sys.stderr.write(f"Error: Command '{command_name}' not implemented yet\n")
+            sys.exit(1)
 
-    try:
-        handler(args)
+        # Already loaded by the commands module; only its user-facing errors
+        # (plus bad IDs/statuses and filesystem failures) are reported tersely,
+        # anything else is a bug and keeps its traceback
+        from taskpy.legacy.storage import StorageError
+
+        try:
+            handler(args)
+        except (StorageError, ValueError, OSError) as e:
+            sys.stderr.write(f"Error: {e}\n")
+            sys.exit(1)
     except KeyboardInterrupt:
-        print("\nInterrupted")
+        sys.stderr.write("\nInterrupted\n")
         sys.exit(130)
-    except Exception as e:
-        print(f"Error: {e}")
-        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -46,17 +46,17 @@ def parse_task_ids(raw_ids: List[str]) -> List[str]:
         parse_task_ids(["FEAT-01,FEAT-02", "BUGS-03"])
         # Returns: ["FEAT-01", "FEAT-02", "BUGS-03"]
     """
+    seen = set()
     task_ids = []
     for item in raw_ids:
         # Split on comma if present
-        if ',' in item:
-            task_ids.extend([tid.strip().upper() for tid in item.split(',') if tid.strip()])
-        else:
-            task_ids.append(item.strip().upper())
-
-    # Remove duplicates while preserving order
-    seen = set()
-    return [tid for tid in task_ids if tid not in seen and not seen.add(tid)]
+        for tid in item.split(',') if ',' in item else (item,):
+            tid = tid.strip().upper()
+            # Drop blanks and duplicates in the same pass, preserving order
+            if tid and tid not in seen:
+                seen.add(tid)
+                task_ids.append(tid)
+    return task_ids
 
 
 def log_override(storage: TaskStorage, task_id: str, from_status: str, to_status: str, reason: Optional[str] = None) -> Optional[Task]:
@@ -163,19 +163,19 @@ def validate_active_to_qa(task: Task) -> tuple[bool, list[str]]:
     return (len(blockers) == 0, blockers)
 
 
-def validate_qa_to_done(task: Task) -> tuple[bool, list[str]]:
+def validate_qa_to_done(task: Task, commit_hash: Optional[str] = None) -> tuple[bool, list[str]]:
     """
     Validate qa → done promotion.
 
     Requirements:
-    - Must have commit hash
+    - Must have commit hash (given here or already on the task)
 
     Returns:
         (is_valid, list of blockers)
     """
     blockers = []
 
-    if not task.commit_hash:
+    if not (commit_hash or task.commit_hash):
         blockers.append("Task needs commit hash (use: taskpy promote TASK-ID --commit HASH)")
 
     return (len(blockers) == 0, blockers)
@@ -232,13 +232,8 @@ def validate_promotion(task: Task, target_status: TaskStatus, commit_hash: Optio
 
     # qa → done
     elif current == TaskStatus.QA and target_status == TaskStatus.DONE:
-        # Temporarily set commit_hash for validation
-        original_hash = task.commit_hash
-        if commit_hash:
-            task.commit_hash = commit_hash
-        result = validate_qa_to_done(task)
-        task.commit_hash = original_hash
-        return result
+        # Allow commit_hash to be provided as argument
+        return validate_qa_to_done(task, commit_hash)
 
     # No gates for other transitions
     return (True, [])
@@ -937,6 +932,11 @@ def cmd_stoplight(args):
         sys.exit(1)
 
 
+# Kanban columns, left to right
+_KANBAN_ORDER = (TaskStatus.STUB, TaskStatus.BACKLOG, TaskStatus.READY, TaskStatus.ACTIVE,
+                 TaskStatus.QA, TaskStatus.DONE)
+
+
 def cmd_kanban(args):
     """Display kanban board."""
     storage = get_storage()
@@ -947,8 +947,7 @@ def cmd_kanban(args):
 
     # Group tasks by status
     tasks_by_status = {}
-    for status in [TaskStatus.STUB, TaskStatus.BACKLOG, TaskStatus.READY, TaskStatus.ACTIVE,
-                   TaskStatus.QA, TaskStatus.DONE]:
+    for status in _KANBAN_ORDER:
         tasks_by_status[status] = []
 
     # Read all tasks from manifest
@@ -967,8 +966,7 @@ def cmd_kanban(args):
         tasks_by_status[status] = _sort_tasks(tasks_by_status[status], sort_mode)
 
     # Display columns
-    for status in [TaskStatus.STUB, TaskStatus.BACKLOG, TaskStatus.READY, TaskStatus.ACTIVE,
-                   TaskStatus.QA, TaskStatus.DONE]:
+    for status in _KANBAN_ORDER:
         display_kanban_column(status.value, tasks_by_status[status])
 
 
@@ -1318,7 +1316,7 @@ def cmd_resolve(args):
     task = storage.read_task_file(path)
 
     # Validate task is bug-like
-    if not re.match(r'^(BUGS|REG|DEF)', task.epic):
+    if not task.epic.startswith(('BUGS', 'REG', 'DEF')):
         print_error(f"Resolve command only works for bug-like tasks (BUGS*, REG*, DEF*)")
         print_error(f"Task {args.task_id} has epic: {task.epic}")
         print_error(f"Use normal promote workflow for feature tasks")
@@ -2674,25 +2672,13 @@ def cmd_help(args):
     """Display help - if no topic given, show main help like --help."""
     # If no topic specified, show main help (same as --help)
     if not args.topic:
-        from taskpy import __version__
-        from pathlib import Path
+        from taskpy.legacy.cli import create_parser, render_help_banner
 
         # Display logo and version (same as --version)
-        logo_path = Path(__file__).parent / "logo.txt"
-        try:
-            with open(logo_path, "r") as f:
-                logo = f.read().rstrip()
-            print(logo)
-        except FileNotFoundError:
-            # Fallback if logo not found
-            print("TaskPy")
-
-        print(f"Version: {__version__} | License: AGPLv3")
-        print("Copyright © 2025 Qodeninja/SnekFX")
+        print(render_help_banner())
         print()
 
         # Then show command help
-        from taskpy.legacy.cli import create_parser
         parser = create_parser()
         parser.print_help()
         return
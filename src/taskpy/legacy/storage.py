@@ -8,11 +8,13 @@ Handles:
 - Kanban directory structure
 """
 
+import contextlib
 import csv
+import io
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, List, Optional, Dict, Any, Tuple
 import sys
 
 # TOML parsing
@@ -575,15 +577,7 @@ signoff_mode = false
         frontmatter_text = content[4:end_idx]
         body = content[end_idx + 5:].strip()
 
-        # Parse YAML frontmatter using full YAML parser for complex structures
-        import yaml
-        try:
-            metadata = yaml.safe_load(frontmatter_text)
-            if metadata is None:
-                metadata = {}
-        except yaml.YAMLError:
-            # Fallback to simple parser for backward compatibility
-            metadata = self._parse_simple_yaml(frontmatter_text)
+        metadata = self._parse_frontmatter(frontmatter_text)
 
         # Build Task object
         # Handle both dict (from yaml.safe_load) and string (from simple parser) metadata
@@ -685,6 +679,37 @@ signoff_mode = false
 
         return task
 
+    def read_task_frontmatter(self, path: Path) -> Dict[str, Any]:
+        """
+        Parse only the YAML frontmatter of a task file.
+
+        Reads line by line up to the closing delimiter, so the body is never
+        read. Newlines are translated as read_text() does, so CRLF files
+        parse like LF ones. Use read_task_file() when a full Task is needed.
+
+        Args:
+            path: Path to task markdown file
+
+        Returns:
+            Frontmatter metadata dict
+
+        Raises:
+            StorageError: If file format is invalid
+        """
+        with open(path, 'r', newline=None) as f:
+            if f.readline() != '---\n':
+                raise StorageError(f"Invalid task file format: {path} (missing frontmatter)")
+
+            frontmatter_lines = []
+            for line in f:
+                if line == '---\n':
+                    break
+                frontmatter_lines.append(line)
+            else:
+                raise StorageError(f"Invalid task file format: {path} (unclosed frontmatter)")
+
+        return self._parse_frontmatter(''.join(frontmatter_lines))
+
     def write_task_file(self, task: Task):
         """
         Write task to markdown file with YAML frontmatter.
@@ -758,6 +783,28 @@ signoff_mode = false
         # Update manifest
         self._update_manifest_row(task)
 
+    def format_manifest_row(self, task: Task) -> str:
+        """Format a task as one TSV manifest line (including the newline)."""
+        buffer = io.StringIO()
+        csv.writer(buffer, delimiter='\t').writerow(task.to_manifest_row())
+        return buffer.getvalue()
+
+    @contextlib.contextmanager
+    def open_manifest_writer(self, buffer_size: int = 1 << 20):
+        """
+        Open manifest.tsv for a full rewrite through a large write buffer.
+
+        The header row is written on entry; callers write formatted rows to
+        the yielded file object. The buffer coalesces row writes into a few
+        large flushes.
+
+        Args:
+            buffer_size: Size of the underlying write buffer in bytes
+        """
+        with open(self.manifest_file, 'w', newline='', buffering=buffer_size) as f:
+            csv.writer(f, delimiter='\t').writerow(MANIFEST_HEADERS)
+            yield f
+
     def _update_manifest_row(self, task: Task):
         """Update or insert task in manifest TSV."""
         # Read existing rows
@@ -774,21 +821,26 @@ signoff_mode = false
                     header_row = MANIFEST_HEADERS
                 for row in reader:
                     if row and row[0] == task.id:
-                        # Update existing row
-                        rows.append(task.to_manifest_row())
+                        # Mark where the updated row goes
+                        rows.append(None)
                         task_found = True
                     else:
                         rows.append(row)
 
         # Append if new task
         if not task_found:
-            rows.append(task.to_manifest_row())
+            rows.append(None)
 
         # Write back
+        task_line = self.format_manifest_row(task)
         with open(self.manifest_file, 'w', newline='') as f:
             writer = csv.writer(f, delimiter='\t')
             writer.writerow(header_row)
-            writer.writerows(rows)
+            for row in rows:
+                if row is None:
+                    f.write(task_line)
+                else:
+                    writer.writerow(row)
 
     def rebuild_manifest(self) -> int:
         """Rebuild manifest.tsv by scanning all status directories.
@@ -796,31 +848,113 @@ signoff_mode = false
         Returns:
             Number of tasks written to the manifest.
         """
-        tasks: List[Task] = []
+        return self.rebuild_manifest_from_disk()
+
+    def rebuild_manifest_from_disk(
+        self,
+        paths: Optional[List[Path]] = None,
+        read_fn: Optional[Callable[[Path], Task]] = None,
+        workers: int = 1,
+        on_error: Optional[Callable[[Path, Exception], None]] = None,
+        on_task: Optional[Callable[[Task], None]] = None,
+    ) -> int:
+        """Rebuild manifest.tsv from task files in a single write.
+
+        Files are read serially by default. Passing workers > 1 reads them on
+        a thread pool instead, which pays off for the bulk rebuild scripts in
+        bin/ but costs more than it saves on a normal CLI invocation. Either
+        way the manifest is written once via rebuild_manifest_bulk().
 
-        for status in TaskStatus:
-            status_dir = self.status_dir / status.value
-            if not status_dir.exists():
-                continue
+        Args:
+            paths: Task files to index (default: every *.md in the status directories)
+            read_fn: Parser for a single file (default: read_task_file)
+            workers: Maximum reader threads (1 reads in the calling thread)
+            on_error: Called with (path, exception) for unreadable files, which
+                are then skipped. When omitted, the first failure raises.
+            on_task: Called with each task read, in path order (e.g. to report progress)
 
-            for path in sorted(status_dir.glob('*.md')):
-                try:
-                    task = self.read_task_file(path)
-                except Exception as exc:  # pragma: no cover - defensive guard
+        Returns:
+            Number of tasks written to the manifest.
+
+        Raises:
+            StorageError: If a task file cannot be read and on_error is not given
+        """
+        if paths is None:
+            paths = []
+            for status in TaskStatus:
+                status_dir = self.status_dir / status.value
+                if status_dir.exists():
+                    paths.extend(sorted(status_dir.glob('*.md')))
+
+        read_fn = read_fn or self.read_task_file
+
+        def read_one(path: Path):
+            try:
+                return path, read_fn(path), None
+            except Exception as exc:
+                return path, None, exc
+
+        with contextlib.ExitStack() as stack:
+            if workers > 1 and len(paths) > 1:
+                # Imported here: concurrent.futures is slow to import and only
+                # the bulk rebuild scripts ask for a pool
+                from concurrent.futures import ThreadPoolExecutor
+                executor = stack.enter_context(
+                    ThreadPoolExecutor(max_workers=min(workers, len(paths)))
+                )
+                results = executor.map(read_one, paths)
+            else:
+                results = map(read_one, paths)
+
+            tasks: List[Task] = []
+            for path, task, exc in results:
+                if exc is None:
+                    tasks.append(task)
+                    if on_task is not None:
+                        on_task(task)
+                elif on_error is not None:
+                    on_error(path, exc)
+                else:
                     raise StorageError(f"Failed to load task file {path}: {exc}") from exc
-                tasks.append(task)
 
         # Deterministic ordering keeps manifest diffs readable
         tasks.sort(key=lambda task: (task.epic, task.number))
 
-        with open(self.manifest_file, 'w', newline='') as f:
+        return self.rebuild_manifest_bulk(tasks)
+
+    def rebuild_manifest_bulk(self, tasks: List[Task]) -> int:
+        """Replace manifest.tsv with rows for the given tasks in one pass.
+
+        Rows stream through open_manifest_writer()'s buffer, so rebuilding
+        N tasks costs a handful of writes instead of N read/rewrite cycles
+        through _update_manifest_row().
+
+        Args:
+            tasks: Tasks to index, in the order they should appear
+
+        Returns:
+            Number of tasks written to the manifest.
+        """
+        with self.open_manifest_writer() as f:
             writer = csv.writer(f, delimiter='\t')
-            writer.writerow(MANIFEST_HEADERS)
-            for task in tasks:
-                writer.writerow(task.to_manifest_row())
+            writer.writerows(task.to_manifest_row() for task in tasks)
 
         return len(tasks)
 
+    def _parse_frontmatter(self, frontmatter_text: str) -> Dict[str, Any]:
+        """Parse frontmatter text with YAML, falling back to the simple parser."""
+        # Parse YAML frontmatter using full YAML parser for complex structures
+        import yaml
+        try:
+            metadata = yaml.safe_load(frontmatter_text)
+            if metadata is None:
+                metadata = {}
+        except yaml.YAMLError:
+            # Fallback to simple parser for backward compatibility
+            metadata = self._parse_simple_yaml(frontmatter_text)
+
+        return metadata
+
     def _parse_simple_yaml(self, text: str) -> Dict[str, str]:
         """Parse simplified YAML (key: value format)."""
         data = {}
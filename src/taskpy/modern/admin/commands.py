@@ -540,7 +540,12 @@ def cmd_overrides(args):
 
         for task_file in status_subdir.glob('*.md'):
             try:
-                task = load_task_from_path(task_file)
+                # Most tasks were never overridden; a substring check on the
+                # raw file spares parsing their frontmatter
+                raw = task_file.read_text()
+                if 'override' not in raw:
+                    continue
+                task = load_task_from_path(task_file, raw)
 
                 # Extract override entries from task history
                 # Note: Accept both 'override' and legacy 'override_*' actions for backward compat
@@ -9,7 +9,7 @@ def register():
     return {
         "archive": {
             "func": cmd_archive,
-            "help": "Archive done tasks with signoff gating",
+            "help": "Archive done tasks (done -> archived) with optional bulk support",
             "parser": setup_archive_parser,
         }
     }
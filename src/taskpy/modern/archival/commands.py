@@ -14,20 +14,10 @@ from taskpy.modern.shared.config import (
     load_signoff_list,
     remove_signoff_tickets,
 )
+from taskpy.modern.shared.tasks import parse_task_ids
 from taskpy.modern.shared.utils import require_initialized
 
 
-def _parse_task_ids(raw_ids: List[str]) -> List[str]:
-    ids: List[str] = []
-    for item in raw_ids:
-        if "," in item:
-            ids.extend([p.strip().upper() for p in item.split(",") if p.strip()])
-        else:
-            ids.append(item.strip().upper())
-    seen = set()
-    return [tid for tid in ids if tid not in seen and not seen.add(tid)]
-
-
 def _collect_done_tasks(storage: TaskStorage) -> List[Tuple[str, Path]]:
     done_dir = storage.status_dir / TaskStatus.DONE.value
     results: List[Tuple[str, Path]] = []
@@ -80,7 +70,7 @@ def cmd_archive(args):
             return
     else:
         raw_ids = getattr(args, "task_ids", []) or []
-        task_ids = _parse_task_ids(raw_ids)
+        task_ids = parse_task_ids(raw_ids)
         if not task_ids:
             print_error("Provide task IDs or use --all-done to archive all done tasks")
             sys.exit(1)
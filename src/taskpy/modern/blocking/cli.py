@@ -9,12 +9,12 @@ def register():
     return {
         'block': {
             'func': cmd_block,
-            'help': 'Block a task with a required reason',
+            'help': 'Block task(s) with a required reason',
             'parser': _setup_block_parser,
         },
         'unblock': {
             'func': cmd_unblock,
-            'help': 'Unblock a task and return it to backlog',
+            'help': 'Unblock task(s) and move them back to backlog',
             'parser': _setup_unblock_parser,
         },
     }
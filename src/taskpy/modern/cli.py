@@ -43,9 +43,28 @@ GLOBAL_FLAG_MAP = {
 }
 
 
-def build_cli():
+def _sniff_command(argv, commands):
+    """Return the command an argument list dispatches to, if it names one.
+
+    Only the first token is considered: global flags are already stripped
+    by _extract_global_flags(), and anything else in front of the command
+    (-h, typos) needs the full parser.
+    """
+    if argv and argv[0] in commands:
+        return argv[0]
+    return None
+
+
+def build_cli(argv=None):
     """Build CLI with all registered features.
 
+    Args:
+        argv: Arguments the parser will see. When they name a command, only
+            that command's parser is set up in full; every other command is
+            added as a bare stub so its name still parses and lists. When
+            they hold no command at all, every command is a stub carrying
+            its registered help.
+
     Returns:
         ArgumentParser: Configured argument parser
     """
@@ -68,16 +87,30 @@ def build_cli():
     # Register all feature modules
     features = [nfrs, epics, core, sprint, workflow, display, admin, milestones, linking, blocking, flags, signoff, archival, tags, search, tour]
 
+    # Get command registrations from every feature
+    commands = {}
     for feature in features:
-        # Get command registrations from feature
-        commands = feature.cli.register()
+        commands.update(feature.cli.register())
+
+    sniffed = _sniff_command(argv, commands)
+    # Bare `taskpy` or `taskpy --help` only lists commands: registration
+    # help is enough, no command parser needs setting up
+    listing_only = argv is not None and all(token.startswith('-') for token in argv)
+
+    for cmd_name, cmd_info in commands.items():
+        if listing_only:
+            subparsers.add_parser(cmd_name, help=cmd_info['help'], add_help=False)
+            continue
+        if sniffed is not None and cmd_name != sniffed:
+            # Only the name can surface on this run (usage, invalid choice)
+            subparsers.add_parser(cmd_name, add_help=False)
+            continue
 
-        for cmd_name, cmd_info in commands.items():
-            # Setup parser for this command
-            cmd_parser = cmd_info['parser'](subparsers)
+        # Setup parser for this command
+        cmd_parser = cmd_info['parser'](subparsers)
 
-            # Set the command function
-            cmd_parser.set_defaults(func=cmd_info['func'])
+        # Set the command function
+        cmd_parser.set_defaults(func=cmd_info['func'])
 
     return parser
 
@@ -125,7 +158,7 @@ def main(argv=None):
 
     flag_values, remaining = _extract_global_flags(argv)
 
-    parser = build_cli()
+    parser = build_cli(remaining)
 
     # Parse arguments
     args = parser.parse_args(remaining)
@@ -9,6 +9,12 @@ from .delete import cmd_delete
 from .trash import cmd_trash
 from .recover import cmd_recover
 
+# argparse choices, shared as immutable tuples
+_LIST_SORT_CHOICES = ('priority', 'status', 'sp', 'created', 'updated', 'id', 'epic')
+_LIST_FORMAT_CHOICES = ('table', 'cards', 'ids', 'tsv')
+_PRIORITY_CHOICES = ('critical', 'high', 'medium', 'low')
+_CREATE_STATUS_CHOICES = ('stub', 'backlog', 'ready', 'active', 'qa', 'blocked')
+
 
 def register():
     """Register core commands with main CLI.
@@ -51,7 +57,7 @@ def register():
         },
         'delete': {
             'func': cmd_delete,
-            'help': 'Move a task to the trash (soft delete)',
+            'help': 'Move a task to trash (soft delete)',
             'parser': setup_delete_parser
         },
         'trash': {
@@ -61,7 +67,7 @@ def register():
         },
         'recover': {
             'func': cmd_recover,
-            'help': 'Recover a task from trash by auto_id',
+            'help': 'Recover task from trash by auto_id',
             'parser': setup_recover_parser
         }
     }
@@ -94,11 +100,11 @@ def setup_list_parser(subparsers):
 
     # Sorting
     parser.add_argument('--sort',
-                       choices=['priority', 'status', 'sp', 'created', 'updated', 'id', 'epic'],
+                       choices=_LIST_SORT_CHOICES,
                        default='priority',
                        help='Sort order')
     parser.add_argument('--format',
-                       choices=['table', 'cards', 'ids', 'tsv'],
+                       choices=_LIST_FORMAT_CHOICES,
                        default='table',
                        help='Output format (table default)')
     parser.add_argument('--with', dest='columns', help='Comma-separated columns to display (no spaces, e.g., id,title,status,sp,tags)')
@@ -144,9 +150,9 @@ def setup_create_parser(subparsers):
 
     parser.add_argument('--sp', '--story-points', dest='story_points', type=int, default=0,
                        help='Story points estimate')
-    parser.add_argument('--priority', choices=['critical', 'high', 'medium', 'low'],
+    parser.add_argument('--priority', choices=_PRIORITY_CHOICES,
                        default='medium', help='Task priority')
-    parser.add_argument('--status', choices=['stub', 'backlog', 'ready', 'active', 'qa', 'blocked'],
+    parser.add_argument('--status', choices=_CREATE_STATUS_CHOICES,
                        default='stub', help='Initial status (default: stub for incomplete tasks)')
     parser.add_argument('--tags', help='Comma-separated tags')
     parser.add_argument('--milestone', help='Assign to milestone (e.g., milestone-1)')
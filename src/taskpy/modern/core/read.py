@@ -12,6 +12,7 @@ from taskpy.modern.shared.tasks import (
     load_task,
     parse_task_ids,
     sort_manifest_rows,
+    task_file_index,
     format_title,
 )
 from taskpy.modern.views import ListView, ColumnConfig, show_card
@@ -131,16 +132,15 @@ def cmd_list(args):
     columns = _build_columns(selected_columns)
 
     if format_mode == 'ids':
-        for task in tasks:
-            print(task['id'])
+        # One write for the whole listing rather than a print() per task
+        sys.stdout.write("".join(f"{task['id']}\n" for task in tasks))
         return
 
     if format_mode == 'tsv':
-        headers = [col.name for col in columns]
-        print("\t".join(headers))
-        for task in tasks:
-            row = [col.get_value(task) for col in columns]
-            print("\t".join(row))
+        lines = ["\t".join(col.name for col in columns)]
+        lines.extend("\t".join([col.get_value(task) for col in columns]) for task in tasks)
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
         return
 
     if format_mode == 'cards':
@@ -190,11 +190,14 @@ def cmd_show(args):
         print_error("No valid task IDs provided")
         sys.exit(1)
 
+    # Several IDs: list the status folders once rather than probe per ID
+    index = task_file_index(Path.cwd()) if len(task_ids) > 1 else None
+
     # Collect all tasks
     tasks_to_display = []
     for task_id in task_ids:
         try:
-            task = load_task(task_id, Path.cwd())
+            task = load_task(task_id, Path.cwd(), index)
             tasks_to_display.append(task)
         except FileNotFoundError:
             print_error(f"Task not found: {task_id}")
@@ -205,11 +208,14 @@ def cmd_show(args):
         print_error("No valid tasks to display")
         sys.exit(1)
 
+    mode = get_output_mode()
+    is_data = mode == OutputMode.DATA
+
     # Display tasks
     for i, task in enumerate(tasks_to_display):
         # Add divider between tasks (except before first)
         if i > 0:
-            if get_output_mode() == OutputMode.DATA:
+            if is_data:
                 print("\n" + "=" * 80 + "\n")
             else:
                 print()  # Just blank line in boxy mode (boxy handles dividers)
@@ -237,10 +243,10 @@ def cmd_show(args):
                 references_list.append(f"Docs: {', '.join(references['docs'])}")
             task_dict['references'] = '\n'.join(references_list)
 
-        show_card(task_dict, output_mode=get_output_mode())
+        show_card(task_dict, output_mode=mode)
 
         # Show metadata if in data mode
-        if get_output_mode() == OutputMode.DATA:
+        if is_data:
             print(f"\nCreated: {task.created.isoformat()}")
             print(f"Updated: {task.updated.isoformat()}")
             if task.nfrs:
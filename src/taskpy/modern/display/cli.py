@@ -3,6 +3,9 @@
 import argparse
 from .commands import cmd_info, cmd_stoplight, cmd_kanban, cmd_history, cmd_stats
 
+# argparse choices, shared as immutable tuples
+_KANBAN_SORT_CHOICES = ('priority', 'created', 'updated', 'id')
+
 
 def register():
     """Register display commands with main CLI.
@@ -25,7 +28,7 @@ def register():
         },
         'stoplight': {
             'func': cmd_stoplight,
-            'help': 'Validate gates with exit codes (for CI)',
+            'help': 'Validate gates with exit codes (0=ready, 1=blocked, 2=error)',
             'parser': setup_stoplight_parser
         },
         'kanban': {
@@ -96,7 +99,7 @@ def setup_kanban_parser(subparsers):
         help='Display kanban board'
     )
     parser.add_argument('--epic', help='Filter by epic')
-    parser.add_argument('--sort', choices=['priority', 'created', 'updated', 'id'],
+    parser.add_argument('--sort', choices=_KANBAN_SORT_CHOICES,
                         default='priority', help='Sort mode (default: priority)')
 
     return parser
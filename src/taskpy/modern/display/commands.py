@@ -22,6 +22,7 @@ from taskpy.modern.shared.tasks import (
     load_task_from_path,
     load_manifest,
     sort_manifest_rows,
+    task_file_index,
 )
 from taskpy.modern.shared.aggregations import (
     filter_by_epic,
@@ -45,7 +46,7 @@ STATUS_BLOCKED = "blocked"
 
 
 # Import validation function from workflow module
-from taskpy.modern.workflow.commands import validate_promotion
+from taskpy.modern.workflow.commands import WORKFLOW_INDEX, WORKFLOW_ORDER, validate_promotion
 
 
 # =============================================================================
@@ -67,9 +68,6 @@ def cmd_info(args):
     path, current_status = result
     task = load_task_from_path(path)
 
-    # Workflow order
-    workflow = [STATUS_STUB, STATUS_BACKLOG, STATUS_READY, STATUS_ACTIVE, STATUS_QA, STATUS_DONE]
-
     print_info(f"Task: {args.task_id}")
     print(f"Current Status: {current_status}")
     print(f"Title: {task.title}")
@@ -90,12 +88,12 @@ def cmd_info(args):
         if current_status == STATUS_ARCHIVED:
             print("Archived tasks must be reactivated before additional work.")
         return
-    elif current_status in workflow:
-        current_idx = workflow.index(current_status)
-        if current_idx >= len(workflow) - 1:
+    elif current_status in WORKFLOW_INDEX:
+        current_idx = WORKFLOW_INDEX[current_status]
+        if current_idx >= len(WORKFLOW_ORDER) - 1:
             print_success("Task is at final status (done)")
             return
-        next_status = workflow[current_idx + 1]
+        next_status = WORKFLOW_ORDER[current_idx + 1]
         print(f"Next Status: {next_status}")
         print()
     else:
@@ -141,17 +139,17 @@ def cmd_stoplight(args):
         sys.exit(2)  # Blocked
 
     # Determine next status in workflow
-    workflow = [STATUS_STUB, STATUS_BACKLOG, STATUS_READY,
-                STATUS_ACTIVE, STATUS_QA, STATUS_DONE]
-
     if current_status == STATUS_REGRESSION:
         next_status = STATUS_QA
     else:
-        current_idx = workflow.index(current_status)
-        if current_idx >= len(workflow) - 1:
+        current_idx = WORKFLOW_INDEX.get(current_status)
+        if current_idx is None:
+            print_error(f"Unknown workflow status: {current_status}")
+            sys.exit(2)
+        if current_idx >= len(WORKFLOW_ORDER) - 1:
             print_success(f"Task {task.id} is already at final status ({current_status})")
             sys.exit(0)
-        next_status = workflow[current_idx + 1]
+        next_status = WORKFLOW_ORDER[current_idx + 1]
 
     # Check gate requirements
     is_valid, blockers = validate_promotion(task, next_status, None)
@@ -180,16 +178,16 @@ def cmd_kanban(args):
     rows = load_manifest(root)
     epic_filter = getattr(args, 'epic', None)
     sort_mode = getattr(args, 'sort', 'priority')
-    statuses = [STATUS_STUB, STATUS_BACKLOG, STATUS_READY,
-                STATUS_ACTIVE, STATUS_QA, STATUS_DONE]
+    statuses = WORKFLOW_ORDER
     grouped: Dict[str, List[Dict[str, Any]]] = {status: [] for status in statuses}
 
+    epic = epic_filter.upper() if epic_filter else None
     for row in rows:
-        if epic_filter and row['epic'] != epic_filter.upper():
+        if epic and row['epic'] != epic:
             continue
-        status = row['status']
-        if status in grouped:
-            grouped[status].append(row)
+        bucket = grouped.get(row['status'])
+        if bucket is not None:
+            bucket.append(row)
 
     for status in grouped:
         grouped[status] = sort_manifest_rows(grouped[status], sort_mode)
@@ -236,11 +234,13 @@ def cmd_history(args):
         # Read all tasks from manifest
         rows = load_manifest(root)
 
-        # Collect all tasks with history
+        # Collect all tasks with history, resolving every file from one
+        # listing of the status folders rather than probing per task
+        index = task_file_index(root)
         tasks_with_history = []
         for row in rows:
             task_id = row['id']
-            result = find_task_file(task_id)
+            result = find_task_file(task_id, root, index)
             if result:
                 path, _ = result
                 try:
@@ -270,12 +270,13 @@ def cmd_history(args):
         print_success(f"History for {len(tasks_with_history)} tasks ({total_entries} total entries)", "All Task History")
         print()
 
+        # One write per task rather than a print() per history line
         for task in tasks_with_history:
-            print(f"[{task.id}] {task.title}")
+            lines = [f"[{task.id}] {task.title}"]
             for entry in task.history:
-                for line in format_history_entry(entry):
-                    print(line)
-            print()
+                lines.extend(format_history_entry(entry))
+            lines.append("\n")
+            sys.stdout.write("\n".join(lines))
         return
 
     # Single task mode
@@ -310,9 +311,11 @@ def cmd_history(args):
         print_success(f"History for {args.task_id} ({len(task.history)} entries)", "Task History")
         print()
 
+        lines = []
         for entry in task.history:
-            for line in format_history_entry(entry):
-                print(line)
+            lines.extend(format_history_entry(entry))
+        lines.append("")
+        sys.stdout.write("\n".join(lines))
 
     except Exception as e:
         print_error(f"Error reading task history: {e}")
@@ -9,7 +9,7 @@ def register():
     return {
         'flag': {
             'func': cmd_flag,
-            'help': 'Manage feature flags',
+            'help': 'Enable, disable, or list feature flags',
             'parser': setup_flag_parser,
         }
     }
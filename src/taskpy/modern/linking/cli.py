@@ -10,7 +10,7 @@ def register():
     return {
         'link': {
             'func': cmd_link,
-            'help': 'Link references (code/docs/tests/issues) to a task',
+            'help': 'Attach references or issues to a task',
             'parser': _setup_link_parser,
         },
         'issues': {
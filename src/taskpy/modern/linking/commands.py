@@ -10,7 +10,7 @@ from taskpy.modern.shared.tasks import (
     find_task_file,
     load_task,
     write_task,
-    append_issue,
+    append_issues,
     read_issues,
     parse_task_ids,
 )
@@ -62,8 +62,7 @@ def cmd_link(args):
             write_task(task)
 
             if args.issue:
-                for desc in args.issue:
-                    append_issue(path, desc)
+                append_issues(path, args.issue)
 
             print_success(f"References linked to {task_id}")
         except Exception as exc:
@@ -20,7 +20,7 @@ def register():
     return {
         'milestones': {
             'func': cmd_milestones,
-            'help': 'List all milestones',
+            'help': 'List all milestones sorted by priority',
             'parser': setup_milestones_parser
         },
         'milestone': {
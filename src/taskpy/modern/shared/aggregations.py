@@ -115,11 +115,22 @@ def filter_by_epic(rows: Iterable[ManifestRow], epic: str) -> List[ManifestRow]:
 
 
 def get_project_stats(rows: Sequence[ManifestRow]) -> Dict[str, Any]:
+    # One pass for all three tallies; same results as sum_story_points(),
+    # count_by_status() and count_by_priority()
+    total_story_points = 0
+    by_status: Dict[str, int] = {}
+    by_priority: Dict[str, int] = {}
+    for row in rows:
+        total_story_points += _as_int(row.get("story_points"))
+        status = row.get("status") or "unknown"
+        by_status[status] = by_status.get(status, 0) + 1
+        priority = row.get("priority") or "unknown"
+        by_priority[priority] = by_priority.get(priority, 0) + 1
     return {
         "total_tasks": len(rows),
-        "total_story_points": sum_story_points(rows),
-        "by_status": count_by_status(rows),
-        "by_priority": count_by_priority(rows),
+        "total_story_points": total_story_points,
+        "by_status": by_status,
+        "by_priority": by_priority,
     }
 
 
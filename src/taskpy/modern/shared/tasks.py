@@ -273,11 +273,15 @@ def find_trash_file(auto_id: int, root: Optional[Path] = None) -> Optional[Path]
     return None
 
 
-def load_task_from_path(path: Path) -> TaskRecord:
-    """Load a task directly from an explicit path."""
-    if not path.exists():
+def load_task_from_path(path: Path, raw: Optional[str] = None) -> TaskRecord:
+    """Load a task directly from an explicit path.
+
+    Pass raw when the caller has already read the file, to parse that text
+    instead of reading it again.
+    """
+    if raw is None and not path.exists():
         raise FileNotFoundError(f"Task file not found: {path}")
-    return _read_task_file(path)
+    return _read_task_file(path, raw)
 
 
 def get_manifest_row(task_id: str, root: Optional[Path] = None) -> Optional[Dict[str, str]]:
@@ -340,25 +344,62 @@ def sort_manifest_rows(rows: List[Dict[str, str]], mode: str) -> List[Dict[str,
 
 
 def parse_task_ids(raw_ids: List[str]) -> List[str]:
-    """Normalize comma/space separated task IDs."""
+    """Split space/comma separated task IDs, uppercased and deduplicated in order."""
+    seen = set()
     task_ids: List[str] = []
     for item in raw_ids:
-        if "," in item:
-            task_ids.extend([part.strip().upper() for part in item.split(",") if part.strip()])
-        else:
-            task_ids.append(item.strip().upper())
-
-    seen = set()
-    ordered: List[str] = []
-    for task_id in task_ids:
-        if task_id and task_id not in seen:
-            ordered.append(task_id)
-            seen.add(task_id)
-    return ordered
-
+        # Split on comma if present
+        for tid in item.split(",") if "," in item else (item,):
+            tid = tid.strip().upper()
+            # Drop blanks and duplicates in the same pass, preserving order
+            if tid and tid not in seen:
+                seen.add(tid)
+                task_ids.append(tid)
+    return task_ids
+
+
+def task_file_index(root: Optional[Path] = None) -> Dict[str, Tuple[Path, str]]:
+    """Map every task ID to its (path, status) from one listing per status folder.
+
+    Cheaper than calling find_task_file() per ID once a command resolves
+    several tasks. Status folders are read in find_task_file()'s order, so
+    both agree when a stray copy of a task exists in two folders.
+    """
+    kanban, _ = _kanban_paths(root)
+    status_dir = kanban / "status"
+    try:
+        extra = sorted(
+            entry.name for entry in os.scandir(status_dir)
+            if entry.is_dir() and entry.name not in VALID_STATUSES
+        )
+    except FileNotFoundError:
+        return {}
 
-def find_task_file(task_id: str, root: Optional[Path] = None) -> Optional[Tuple[Path, str]]:
-    """Locate the markdown file for a task."""
+    index: Dict[str, Tuple[Path, str]] = {}
+    for status in STATUS_FOLDERS + extra:
+        try:
+            entries = os.scandir(status_dir / status)
+        except FileNotFoundError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".md"):
+                    index.setdefault(entry.name[:-3], (Path(entry.path), status))
+    return index
+
+
+def find_task_file(
+    task_id: str,
+    root: Optional[Path] = None,
+    index: Optional[Dict[str, Tuple[Path, str]]] = None,
+) -> Optional[Tuple[Path, str]]:
+    """Locate the markdown file for a task.
+
+    Pass an index from task_file_index() to look the task up there
+    instead of probing the status folders.
+    """
+    if index is not None:
+        return index.get(task_id)
     kanban, _ = _kanban_paths(root)
     status_dir = kanban / "status"
     for status in STATUS_FOLDERS:
@@ -373,9 +414,13 @@ def find_task_file(task_id: str, root: Optional[Path] = None) -> Optional[Tuple[
     return None
 
 
-def load_task(task_id: str, root: Optional[Path] = None) -> TaskRecord:
+def load_task(
+    task_id: str,
+    root: Optional[Path] = None,
+    index: Optional[Dict[str, Tuple[Path, str]]] = None,
+) -> TaskRecord:
     """Load a single task markdown file into a TaskRecord."""
-    found = find_task_file(task_id, root)
+    found = find_task_file(task_id, root, index)
     if not found:
         raise FileNotFoundError(f"Task {task_id} not found")
     path, status = found
@@ -384,8 +429,9 @@ def load_task(task_id: str, root: Optional[Path] = None) -> TaskRecord:
     return record
 
 
-def _read_task_file(path: Path) -> TaskRecord:
-    raw = path.read_text()
+def _read_task_file(path: Path, raw: Optional[str] = None) -> TaskRecord:
+    if raw is None:
+        raw = path.read_text()
     if not raw.startswith("---\n"):
         raise ValueError(f"Invalid task file: {path}")
 
@@ -488,10 +534,30 @@ def _read_task_file(path: Path) -> TaskRecord:
 
 def append_issue(task_path: Path, description: str):
     """Append an issue entry to a task markdown file."""
+    append_issues(task_path, [description])
+
+
+def append_issues(task_path: Path, descriptions: List[str]):
+    """Append issue entries to a task markdown file in a single rewrite.
+
+    The file ends up as if append_issue() had been called for each
+    description in turn, but is read and written only once.
+    """
+    if not descriptions:
+        return
     timestamp = utc_now().strftime("%Y-%m-%d %H:%M:%S UTC")
-    issue_line = f"- **{timestamp}** - {description}".strip() + "\n"
+    issue_lines = [f"- **{timestamp}** - {description}".strip() + "\n" for description in descriptions]
 
-    content = task_path.read_text(encoding="utf-8")
+    # One open for the read and the rewrite
+    with task_path.open("r+", encoding="utf-8") as handle:
+        content = _with_issue_lines(handle.read(), issue_lines)
+        handle.seek(0)
+        handle.write(content)
+        handle.truncate()
+
+
+def _with_issue_lines(content: str, issue_lines: List[str]) -> str:
+    """Return task file content with issue lines added to its ISSUES section."""
     lines = content.split("\n")
     issues_idx = None
     in_code_block = False
@@ -513,19 +579,22 @@ def append_issue(task_path: Path, description: str):
             if lines[idx].startswith("## ") and lines[idx].strip() != "## ISSUES":
                 next_section = idx
                 break
-        lines.insert(next_section, issue_line)
+        lines[next_section:next_section] = issue_lines
         content = "\n".join(lines)
     else:
         if not content.endswith("\n"):
             content += "\n"
-        content += f"\n## ISSUES\n\n{issue_line}"
+        content += "\n## ISSUES\n\n" + "\n".join(issue_lines)
 
-    task_path.write_text(content, encoding="utf-8")
+    return content
 
 
 def read_issues(task_path: Path) -> List[str]:
     """Read the ISSUES section from a task file."""
     content = task_path.read_text(encoding="utf-8")
+    # Most tasks have no ISSUES section; skip the line walk for them
+    if "## ISSUES" not in content:
+        return []
     lines = content.split("\n")
     issues_idx = None
     in_code_block = False
@@ -622,8 +691,16 @@ def _serialize_task(task: TaskRecord) -> str:
     return "\n".join(lines)
 
 
-def _update_manifest_row(task: TaskRecord, root: Optional[Path] = None):
+def update_manifest_rows(tasks: List[TaskRecord], root: Optional[Path] = None):
+    """Replace (or add) the manifest rows of several tasks in one rewrite.
+
+    Rows end up as if each task had been written in turn, so commands that
+    save many tasks with update_manifest=False can catch up here once.
+    """
+    if not tasks:
+        return
     _, manifest = _kanban_paths(root)
+    replaced = {task.id for task in tasks}
     rows: List[List[str]] = []
     header = [
         "id",
@@ -655,9 +732,9 @@ def _update_manifest_row(task: TaskRecord, root: Optional[Path] = None):
             except StopIteration:
                 header = header
             for row in reader:
-                if row and row[0] != task.id:
+                if row and row[0] not in replaced:
                     rows.append(row)
-    rows.append(task.to_manifest_row())
+    rows.extend(task.to_manifest_row() for task in tasks)
     with manifest.open("w", newline="") as handle:
         writer = csv.writer(handle, delimiter="\t")
         writer.writerow(header)
@@ -693,7 +770,7 @@ def write_task(task: TaskRecord, root: Optional[Path] = None, update_manifest: b
     path = status_dir / f"{task.id}.md"
     path.write_text(_serialize_task(task))
     if update_manifest:
-        _update_manifest_row(task, root)
+        update_manifest_rows([task], root)
     return path
 
 
@@ -9,7 +9,7 @@ def register():
     return {
         "signoff": {
             "func": cmd_signoff,
-            "help": "Manage signoff tickets for archival gating",
+            "help": "Manage signoff tickets (list/add/remove)",
             "parser": setup_signoff_parser,
         }
     }
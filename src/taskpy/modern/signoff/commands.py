@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from argparse import Namespace
 from pathlib import Path
-from typing import List
 
 from taskpy.legacy.output import print_error, print_info, print_success
 from taskpy.legacy.storage import TaskStorage
@@ -13,22 +12,10 @@ from taskpy.modern.shared.config import (
     load_signoff_list,
     remove_signoff_tickets,
 )
+from taskpy.modern.shared.tasks import parse_task_ids
 from taskpy.modern.shared.utils import require_initialized
 
 
-def _parse_task_ids(raw_ids: List[str]) -> List[str]:
-    """Parse comma/space separated task IDs."""
-    ids: List[str] = []
-    for item in raw_ids:
-        if "," in item:
-            ids.extend([p.strip().upper() for p in item.split(",") if p.strip()])
-        else:
-            ids.append(item.strip().upper())
-    # dedupe preserving order
-    seen = set()
-    return [tid for tid in ids if tid not in seen and not seen.add(tid)]
-
-
 def cmd_signoff(args: Namespace):
     """Entry point for `taskpy signoff`."""
     storage = TaskStorage(Path.cwd())
@@ -47,7 +34,7 @@ def cmd_signoff(args: Namespace):
         return
 
     raw_ids = getattr(args, "task_ids", []) or []
-    task_ids = _parse_task_ids(raw_ids)
+    task_ids = parse_task_ids(raw_ids)
     if not task_ids:
         print_error("No task IDs provided")
         raise SystemExit(1)
@@ -21,6 +21,8 @@ from taskpy.modern.shared.tasks import (
     KANBAN_RELATIVE_PATH,
     parse_task_ids,
     rebuild_manifest,
+    task_file_index,
+    update_manifest_rows,
 )
 from taskpy.modern.views import ListView, ColumnConfig
 
@@ -111,25 +113,35 @@ def _cmd_sprint_add(args):
         sys.exit(1)
 
     failures = []
+    changed = []
+    # Several IDs: list the status folders once rather than probe per ID
+    index = task_file_index() if len(task_ids) > 1 else None
+    # The whole batch is one change; stamp every task with the same time
+    now = utc_now()
+
+    # Task files are written as we go; the manifest is rewritten once at
+    # the end (even if the loop is interrupted), as in `taskpy move`
+    try:
+        for task_id in task_ids:
+            try:
+                task = load_task(task_id, index=index)
+            except FileNotFoundError:
+                print_error(f"Task not found: {task_id}")
+                failures.append(task_id)
+                continue
+
+            if task.in_sprint:
+                print_warning(f"{task_id} is already in the sprint")
+                continue
+
+            task.in_sprint = True
+            task.updated = now
+            write_task(task, update_manifest=False)
+            changed.append(task)
 
-    for task_id in task_ids:
-        result = find_task_file(task_id)
-        if not result:
-            print_error(f"Task not found: {task_id}")
-            failures.append(task_id)
-            continue
-
-        task = load_task(task_id)
-
-        if task.in_sprint:
-            print_warning(f"{task_id} is already in the sprint")
-            continue
-
-        task.in_sprint = True
-        task.updated = utc_now()
-        write_task(task)
-
-        print_success(f"Added {task_id} to sprint")
+            print_success(f"Added {task_id} to sprint")
+    finally:
+        update_manifest_rows(changed)
 
     if failures:
         sys.exit(1)
@@ -149,25 +161,35 @@ def _cmd_sprint_remove(args):
         sys.exit(1)
 
     failures = []
+    changed = []
+    # Several IDs: list the status folders once rather than probe per ID
+    index = task_file_index() if len(task_ids) > 1 else None
+    # The whole batch is one change; stamp every task with the same time
+    now = utc_now()
+
+    # Task files are written as we go; the manifest is rewritten once at
+    # the end (even if the loop is interrupted), as in `taskpy move`
+    try:
+        for task_id in task_ids:
+            try:
+                task = load_task(task_id, index=index)
+            except FileNotFoundError:
+                print_error(f"Task not found: {task_id}")
+                failures.append(task_id)
+                continue
+
+            if not task.in_sprint:
+                print_warning(f"{task_id} is not in the sprint")
+                continue
 
-    for task_id in task_ids:
-        result = find_task_file(task_id)
-        if not result:
-            print_error(f"Task not found: {task_id}")
-            failures.append(task_id)
-            continue
-
-        task = load_task(task_id)
-
-        if not task.in_sprint:
-            print_warning(f"{task_id} is not in the sprint")
-            continue
-
-        task.in_sprint = False
-        task.updated = utc_now()
-        write_task(task)
+            task.in_sprint = False
+            task.updated = now
+            write_task(task, update_manifest=False)
+            changed.append(task)
 
-        print_success(f"Removed {task_id} from sprint")
+            print_success(f"Removed {task_id} from sprint")
+    finally:
+        update_manifest_rows(changed)
 
     if failures:
         sys.exit(1)
@@ -188,13 +210,15 @@ def _cmd_sprint_clear(args):
         print_info("No tasks in sprint")
         return
 
+    index = task_file_index()
+    now = utc_now()
     updated = 0
     for row in sprint_tasks:
-        result = find_task_file(row['id'])
+        result = find_task_file(row['id'], index=index)
         if result:
-            task = load_task(row['id'])
+            task = load_task(row['id'], index=index)
             task.in_sprint = False
-            task.updated = utc_now()
+            task.updated = now
             write_task(task, update_manifest=False)
             updated += 1
 
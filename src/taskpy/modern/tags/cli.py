@@ -9,7 +9,7 @@ def register():
     return {
         "tags": {
             "func": cmd_tags,
-            "help": "Manage task tags (list/add/remove/set/clear)",
+            "help": "List or update tags on tasks",
             "parser": setup_tags_parser,
         }
     }
@@ -4,6 +4,9 @@ import argparse
 from taskpy.modern.shared.utils import add_reason_argument
 from .commands import cmd_promote, cmd_demote, cmd_move, cmd_resolve
 
+# argparse choices, shared as immutable tuples
+_RESOLUTION_CHOICES = ('fixed', 'duplicate', 'cannot_reproduce', 'wont_fix', 'config_change', 'docs_only')
+
 
 def register():
     """Register workflow commands with main CLI.
@@ -36,7 +39,7 @@ def register():
         },
         'resolve': {
             'func': cmd_resolve,
-            'help': 'Resolve bug tasks with special resolution types',
+            'help': 'Resolve BUGS/REG/DEF tasks with resolution types',
             'parser': setup_resolve_parser,
         }
     }
@@ -127,7 +130,7 @@ def setup_resolve_parser(subparsers):
     parser.add_argument(
         '--resolution',
         required=True,
-        choices=['fixed', 'duplicate', 'cannot_reproduce', 'wont_fix', 'config_change', 'docs_only'],
+        choices=_RESOLUTION_CHOICES,
         help='Resolution type'
     )
     add_reason_argument(parser, required=True, help_text='Explanation for this resolution')
@@ -9,7 +9,6 @@ This module provides task workflow management commands:
 Migrated from legacy/commands.py (lines 583-810, 1345-1418, 2080-2115)
 """
 
-import re
 import sys
 from pathlib import Path
 from typing import List, Optional, Dict, Any
@@ -19,6 +18,9 @@ from taskpy.modern.shared.tasks import (
     utc_now,
     find_task_file,
     load_task_from_path,
+    parse_task_ids,
+    task_file_index,
+    update_manifest_rows,
     write_task,
     ensure_initialized,
 )
@@ -42,21 +44,41 @@ STATUS_DONE = "done"
 STATUS_ARCHIVED = "archived"
 STATUS_BLOCKED = "blocked"
 
+# Epic prefixes whose tasks may skip QA via `taskpy resolve`
+RESOLVABLE_EPIC_PREFIXES = ("BUGS", "REG", "DEF")
+
 # Standard workflow progression
-WORKFLOW_ORDER = [STATUS_STUB, STATUS_BACKLOG, STATUS_READY, STATUS_ACTIVE, STATUS_QA, STATUS_DONE]
+WORKFLOW_ORDER = (STATUS_STUB, STATUS_BACKLOG, STATUS_READY, STATUS_ACTIVE, STATUS_QA, STATUS_DONE)
+# Position of each status in WORKFLOW_ORDER
+WORKFLOW_INDEX = {status: idx for idx, status in enumerate(WORKFLOW_ORDER)}
+# Single workflow steps, keyed by (from, to), and the command meant for each
+_WORKFLOW_STEPS = {
+    **{step: 'promote' for step in zip(WORKFLOW_ORDER, WORKFLOW_ORDER[1:])},
+    **{step: 'demote' for step in zip(WORKFLOW_ORDER[1:], WORKFLOW_ORDER)},
+}
 
 
 class TaskMoveError(Exception):
-    """Raised when a workflow move operation fails."""
+    """Raised when a workflow move operation fails.
+
+    task is set when the task was already written to its new location
+    (e.g. removing the old file failed), so a caller that defers manifest
+    updates can still record it.
+    """
+
+    def __init__(self, message: str, task: Optional[TaskRecord] = None):
+        super().__init__(message)
+        self.task = task
 
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
-def load_task_or_exit_modern(task_id: str, root: Optional[Path] = None) -> tuple[TaskRecord, Path, str]:
+def load_task_or_exit_modern(task_id: str, root: Optional[Path] = None,
+                             index: Optional[Dict[str, tuple[Path, str]]] = None) -> tuple[TaskRecord, Path, str]:
     """Return (task, path, status) or exit with error if not found/readable."""
-    result = find_task_file(task_id, root)
+    result = find_task_file(task_id, root, index)
     if not result:
         print_error(f"Task not found: {task_id}")
         sys.exit(1)
@@ -71,34 +93,6 @@ def load_task_or_exit_modern(task_id: str, root: Optional[Path] = None) -> tuple
     return task, path, status
 
 
-def parse_task_ids(raw_ids: List[str]) -> List[str]:
-    """
-    Parse task IDs from user input - supports both space-separated and comma-delimited.
-
-    Args:
-        raw_ids: List of raw ID strings (from argparse nargs='+')
-                 Can contain: ["FEAT-01", "FEAT-02"] or ["FEAT-01,FEAT-02"] or ["FEAT-01, FEAT-02"]
-
-    Returns:
-        List of normalized task IDs (uppercase, deduplicated, order preserved)
-
-    Example:
-        parse_task_ids(["FEAT-01,FEAT-02", "BUGS-03"])
-        # Returns: ["FEAT-01", "FEAT-02", "BUGS-03"]
-    """
-    task_ids = []
-    for item in raw_ids:
-        # Split on comma if present
-        if ',' in item:
-            task_ids.extend([tid.strip().upper() for tid in item.split(',') if tid.strip()])
-        else:
-            task_ids.append(item.strip().upper())
-
-    # Remove duplicates while preserving order
-    seen = set()
-    return [tid for tid in task_ids if tid not in seen and not seen.add(tid)]
-
-
 def _assert_not_strict_override():
     """Exit if strict mode blocks override/forced workflow changes."""
     if is_feature_enabled(STRICT_FLAG_NAME):
@@ -165,7 +159,8 @@ def _archive_from_promote(task: TaskRecord, path: Path, reason: Optional[str], s
     print_success(f"Archived {task.id}", "Task Archived")
 
 
-def log_override(task_id: str, from_status: str, to_status: str, reason: Optional[str] = None, root: Optional[Path] = None) -> Optional[TaskRecord]:
+def log_override(task_id: str, from_status: str, to_status: str, reason: Optional[str] = None, root: Optional[Path] = None,
+                 task: Optional[TaskRecord] = None) -> Optional[TaskRecord]:
     """
     Log override event to task history.
 
@@ -178,18 +173,20 @@ def log_override(task_id: str, from_status: str, to_status: str, reason: Optiona
         to_status: Status being transitioned to
         reason: Optional reason for the override
         root: Optional root path
+        task: Task already loaded by the caller; skips finding and re-reading its file
 
     Returns:
         Updated TaskRecord object with override history entry, or None if task not found
     """
-    # Find and load the task
-    result = find_task_file(task_id, root)
-    if not result:
-        print_warning(f"Could not log override for {task_id}: task not found")
-        return None
+    if task is None:
+        # Find and load the task
+        result = find_task_file(task_id, root)
+        if not result:
+            print_warning(f"Could not log override for {task_id}: task not found")
+            return None
 
-    task_path, _ = result
-    task = load_task_from_path(task_path)
+        task_path, _ = result
+        task = load_task_from_path(task_path)
 
     # Add override entry to task history
     history_entry = {
@@ -206,8 +203,14 @@ def log_override(task_id: str, from_status: str, to_status: str, reason: Optiona
 
 def _move_task(task_id: str, current_path: Path, target_status: str,
                task: Optional[TaskRecord] = None, reason: Optional[str] = None, action: str = "move",
-               root: Optional[Path] = None):
-    """Move a task to a new status and log to history."""
+               root: Optional[Path] = None, update_manifest: bool = True) -> TaskRecord:
+    """Move a task to a new status and log to history.
+
+    With update_manifest=False the manifest row is left for the caller to
+    refresh (see update_manifest_rows), so batch moves rewrite it once. That
+    includes a failure after the write, where TaskMoveError.task is set.
+    """
+    written = False
     try:
         if task is None:
             task = load_task_from_path(current_path)
@@ -225,7 +228,8 @@ def _move_task(task_id: str, current_path: Path, target_status: str,
         task.history.append(history_entry)
 
         # Write to new location first to prevent data loss
-        write_task(task, root)
+        write_task(task, root, update_manifest=update_manifest)
+        written = True
         # Only delete old location after successful write
         current_path.unlink()
 
@@ -235,7 +239,9 @@ def _move_task(task_id: str, current_path: Path, target_status: str,
         )
 
     except Exception as exc:
-        raise TaskMoveError(f"{task_id}: {exc}") from exc
+        raise TaskMoveError(f"{task_id}: {exc}", task if written else None) from exc
+
+    return task
 
 
 # =============================================================================
@@ -281,42 +287,45 @@ def validate_active_to_qa(task: TaskRecord) -> tuple[bool, list[str]]:
 
     # Check if this is a DOCS task
     is_docs_task = task.epic.startswith('DOCS')
+    references = task.references
+    verification = task.verification
 
-    if not task.references.get("code") and not task.references.get("docs"):
+    if not references.get("code") and not references.get("docs"):
         blockers.append("Task needs code or doc references (use: taskpy link TASK-ID --code path/to/file.py or --docs path/to/doc.md)")
 
     # DOCS tasks don't need test references or verification
     if not is_docs_task:
-        if not task.references.get("tests"):
+        if not references.get("tests"):
             blockers.append("Task needs test references (use: taskpy link TASK-ID --test path/to/test.py)")
 
         # Check verification command is set and has passed
-        if not task.verification.get("command"):
+        if not verification.get("command"):
             blockers.append("Task needs verification command (use: taskpy link TASK-ID --verify \"test command\")")
         else:
-            if task.verification.get("status") != "passed":
-                blockers.append(f"Verification must pass (status: {task.verification.get('status', 'pending')}). Run: taskpy verify {task.id} --update")
+            status = verification.get("status", "pending")
+            if status != "passed":
+                blockers.append(f"Verification must pass (status: {status}). Run: taskpy verify {task.id} --update")
     else:
         # DOCS tasks should have doc references
-        if not task.references.get("docs"):
+        if not references.get("docs"):
             blockers.append("DOCS task needs doc references (use: taskpy link TASK-ID --docs path/to/doc.md)")
 
     return (len(blockers) == 0, blockers)
 
 
-def validate_qa_to_done(task: TaskRecord) -> tuple[bool, list[str]]:
+def validate_qa_to_done(task: TaskRecord, commit_hash: Optional[str] = None) -> tuple[bool, list[str]]:
     """
     Validate qa → done promotion.
 
     Requirements:
-    - Must have commit hash
+    - Must have commit hash (given here or already on the task)
 
     Returns:
         (is_valid, list of blockers)
     """
     blockers = []
 
-    if not task.commit_hash:
+    if not (commit_hash or task.commit_hash):
         blockers.append("Task needs commit hash (use: taskpy promote TASK-ID --commit HASH)")
 
     return (len(blockers) == 0, blockers)
@@ -374,9 +383,7 @@ def validate_promotion(task: TaskRecord, target_status: str, commit_hash: Option
     # qa → done
     elif current == STATUS_QA and target_status == STATUS_DONE:
         # Allow commit_hash to be provided as argument
-        if commit_hash:
-            task.commit_hash = commit_hash
-        return validate_qa_to_done(task)
+        return validate_qa_to_done(task, commit_hash)
 
     # No specific validation for other transitions
     return (True, [])
@@ -409,12 +416,12 @@ def cmd_promote(args):
         else:
             # Normal workflow: next in workflow
             try:
-                current_idx = WORKFLOW_ORDER.index(current_status)
+                current_idx = WORKFLOW_INDEX[current_status]
                 if current_idx >= len(WORKFLOW_ORDER) - 1:
                     print_info(f"Task {args.task_id} is already at final status: {current_status}")
                     return
                 target_status = WORKFLOW_ORDER[current_idx + 1]
-            except ValueError:
+            except KeyError:
                 print_error(f"Invalid current status: {current_status}")
                 sys.exit(1)
 
@@ -432,7 +439,7 @@ def cmd_promote(args):
         reason = getattr(args, 'reason', None) or "No reason provided"
 
         # Log override to history and get updated task
-        task = log_override(args.task_id, current_status, target_status, reason, root)
+        task = log_override(args.task_id, current_status, target_status, reason, root, task)
         if not task:
             return
 
@@ -481,17 +488,17 @@ def cmd_demote(args):
             target_status = args.to
         else:
             try:
-                current_idx = WORKFLOW_ORDER.index(current_status)
+                current_idx = WORKFLOW_INDEX[current_status]
                 if current_idx <= 0:
                     print_info(f"Task {args.task_id} is already at initial status: {current_status}")
                     return
                 target_status = WORKFLOW_ORDER[current_idx - 1]
-            except ValueError:
+            except KeyError:
                 print_error(f"Invalid current status: {current_status}")
                 sys.exit(1)
 
         reason = getattr(args, 'reason', None) or "No reason provided"
-        task = log_override(args.task_id, current_status, target_status, reason, root)
+        task = log_override(args.task_id, current_status, target_status, reason, root, task)
         if not task:
             return
     else:
@@ -527,12 +534,12 @@ def cmd_demote(args):
             else:
                 # Normal workflow: previous in workflow
                 try:
-                    current_idx = WORKFLOW_ORDER.index(current_status)
+                    current_idx = WORKFLOW_INDEX[current_status]
                     if current_idx <= 0:
                         print_info(f"Task {args.task_id} is already at initial status: {current_status}")
                         return
                     target_status = WORKFLOW_ORDER[current_idx - 1]
-                except ValueError:
+                except KeyError:
                     print_error(f"Invalid current status: {current_status}")
                     sys.exit(1)
 
@@ -572,30 +579,42 @@ def cmd_move(args):
     successes = []
     failures = []
 
-    # Process each task
-    for task_id in task_ids:
-        try:
-            task, path, current_status = load_task_or_exit_modern(task_id, root)
-        except SystemExit:
-            failures.append((task_id, f"Task not found: {task_id}"))
-            continue
-
-        # Warn if this looks like a workflow transition
-        if current_status in WORKFLOW_ORDER and target_status in WORKFLOW_ORDER:
-            current_idx = WORKFLOW_ORDER.index(current_status)
-            target_idx = WORKFLOW_ORDER.index(target_status)
-            if target_idx == current_idx + 1:
+    # Several IDs: list the status folders once rather than probe per ID.
+    # Each ID is moved once, so the index never goes stale mid-loop
+    index = task_file_index(root) if len(task_ids) > 1 else None
+
+    # Process each task. Task files are written as we go; the manifest is
+    # rewritten once at the end (even if the loop is interrupted) rather
+    # than once per task
+    moved: List[TaskRecord] = []
+    try:
+        for task_id in task_ids:
+            try:
+                task, path, current_status = load_task_or_exit_modern(task_id, root, index)
+            except SystemExit:
+                failures.append((task_id, f"Task not found: {task_id}"))
+                continue
+
+            # Warn if this looks like a workflow transition
+            step = _WORKFLOW_STEPS.get((current_status, target_status))
+            if step == 'promote':
                 print_warning(f"⚠️  {task_id}: Use 'taskpy promote' instead of 'move' for forward workflow transitions")
-            elif target_idx == current_idx - 1:
+            elif step == 'demote':
                 print_warning(f"⚠️  {task_id}: Use 'taskpy demote' instead of 'move' for backward workflow transitions")
 
-        try:
-            _move_task(task_id, path, target_status, task, reason=args.reason, action="move", root=root)
-            successes.append(task_id)
-        except TaskMoveError as exc:
-            failures.append((task_id, str(exc)))
-        except Exception as exc:  # pragma: no cover - unexpected failures
-            failures.append((task_id, str(exc)))
+            try:
+                moved.append(_move_task(task_id, path, target_status, task, reason=args.reason,
+                                        action="move", root=root, update_manifest=False))
+                successes.append(task_id)
+            except TaskMoveError as exc:
+                if exc.task is not None:
+                    # Written to the new status even though the move failed
+                    moved.append(exc.task)
+                failures.append((task_id, str(exc)))
+            except Exception as exc:  # pragma: no cover - unexpected failures
+                failures.append((task_id, str(exc)))
+    finally:
+        update_manifest_rows(moved, root)
 
     # Print summary if multiple tasks
     if len(task_ids) > 1:
@@ -622,7 +641,7 @@ def cmd_resolve(args):
 
     task, path, _ = load_task_or_exit_modern(args.task_id, root)
 
-    if not re.match(r'^(BUGS|REG|DEF)', task.epic):
+    if not task.epic.startswith(RESOLVABLE_EPIC_PREFIXES):
         print_error("Resolve command only works for BUGS*/REG*/DEF* tasks")
         print_error(f"Task {args.task_id} has epic: {task.epic}")
         print_error("Use normal promote workflow for other epics")
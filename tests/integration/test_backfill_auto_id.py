@@ -0,0 +1,46 @@
+"""
+Integration tests for scripts/backfill_auto_id.py.
+"""
+
+import subprocess
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from taskpy.legacy.models import Task, TaskStatus
+from taskpy.legacy.storage import TaskStorage
+
+SCRIPT = Path(__file__).resolve().parents[2] / "scripts" / "backfill_auto_id.py"
+
+
+def test_backfill_skips_malformed_task(tmp_path):
+    """A task that fails to load is skipped; the others and the sequence are still written."""
+    storage = TaskStorage(tmp_path)
+    storage.initialize()
+
+    created = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for number in (1, 2, 3):
+        task = Task(id=f"FEAT-0{number}", title=f"Task {number}", epic="FEAT", number=number)
+        task.created = created + timedelta(days=number)
+        storage.write_task_file(task)
+
+    # Valid frontmatter, but a priority read_task_file() rejects
+    bad_path = storage.get_task_path("FEAT-02", TaskStatus.BACKLOG)
+    bad_text = bad_path.read_text().replace("priority: medium", "priority: urgent")
+    bad_path.write_text(bad_text)
+
+    result = subprocess.run(
+        [sys.executable, str(SCRIPT)],
+        cwd=tmp_path,
+        capture_output=True,
+        text=True
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert "Warning: Failed to update" in result.stdout
+
+    first = storage.read_task_file(storage.get_task_path("FEAT-01", TaskStatus.BACKLOG))
+    third = storage.read_task_file(storage.get_task_path("FEAT-03", TaskStatus.BACKLOG))
+    assert (first.auto_id, third.auto_id) == (1, 3)
+    assert bad_path.read_text() == bad_text
+    assert storage.sequence_file.read_text() == "4\n"
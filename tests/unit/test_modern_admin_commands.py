@@ -152,3 +152,31 @@ def test_cmd_session_commit_and_end(tmp_path, monkeypatch):
     assert record["commits"][0]["hash"] == "abc123"
     assert record["notes"].endswith("All done")
     assert record["duration_seconds"] >= 0
+
+
+def test_cmd_overrides_lists_only_overridden_tasks(tmp_path, monkeypatch, capsys):
+    """cmd_overrides should report override history entries across tasks."""
+    from taskpy.legacy.models import HistoryEntry, utc_now
+    from taskpy.modern.admin.commands import cmd_overrides
+
+    storage = _init_storage(tmp_path)
+    storage.write_task_file(Task(
+        id="TEST-01", epic="TEST", number=1, title="Overridden",
+        status=TaskStatus.QA, story_points=1,
+        history=[HistoryEntry(
+            timestamp=utc_now(), action="override",
+            from_status="active", to_status="qa", reason="urgent fix",
+        )],
+    ))
+    storage.write_task_file(Task(
+        id="TEST-02", epic="TEST", number=2, title="Plain",
+        status=TaskStatus.BACKLOG, story_points=1,
+    ))
+
+    monkeypatch.chdir(tmp_path)
+    cmd_overrides(Namespace())
+
+    output = capsys.readouterr().out
+    assert "Override History (1 total)" in output
+    assert "TEST-01 | active→qa | Reason: urgent fix" in output
+    assert "TEST-02" not in output
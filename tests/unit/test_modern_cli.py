@@ -3,7 +3,11 @@
 from types import SimpleNamespace
 from unittest.mock import patch
 
+import pytest
+
+from taskpy import cli as entry_cli
 from taskpy.modern.cli import (
+    build_cli,
     _configure_output_modes,
     ModernOutputMode,
     LegacyOutputMode,
@@ -52,3 +56,29 @@ def test_configure_output_modes_default_pretty(modern_mode_mock, legacy_mode_moc
 
     modern_mode_mock.assert_called_once_with(ModernOutputMode.PRETTY)
     legacy_mode_mock.assert_called_once_with(LegacyOutputMode.PRETTY)
+
+
+def test_build_cli_sniffed_command_keeps_other_names():
+    """Building for one command still accepts every command name."""
+    parser = build_cli(['show', 'FEAT-01'])
+
+    args = parser.parse_args(['show', 'FEAT-01'])
+    assert args.command == 'show'
+    assert callable(args.func)
+    assert parser.parse_args(['tour']).command == 'tour'
+
+
+def test_build_cli_listing_matches_full_help():
+    """Stub-only listing for bare/--help runs must match the full parser."""
+    assert build_cli([]).format_help() == build_cli().format_help()
+    assert build_cli(['--help']).format_help() == build_cli().format_help()
+
+
+def test_entry_point_exits_cleanly_on_interrupt(capsys):
+    """Ctrl-C during dispatch should exit 130 without a traceback."""
+    with patch('taskpy.modern.cli.main', side_effect=KeyboardInterrupt):
+        with pytest.raises(SystemExit) as excinfo:
+            entry_cli.main(['list'])
+
+    assert excinfo.value.code == 130
+    assert capsys.readouterr().err == "\nInterrupted\n"
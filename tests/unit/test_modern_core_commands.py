@@ -136,6 +136,48 @@ class TestCoreListCommand:
         assert "Tags" in output
         assert "alpha, beta" in output
 
+    def test_list_ids_and_tsv_formats(self, tmp_path, monkeypatch, capsys):
+        """--format ids/tsv print plain lines and nothing else."""
+        storage = TaskStorage(tmp_path)
+        storage.initialize()
+
+        for i in range(1, 4):
+            storage.write_task_file(Task(
+                id=f"TEST-0{i}",
+                epic="TEST",
+                number=i,
+                title=f"Test task {i}",
+                status=TaskStatus.BACKLOG,
+                priority=Priority.MEDIUM,
+                story_points=1,
+            ))
+        storage.rebuild_manifest()
+
+        args = Namespace(
+            epic=None,
+            status=None,
+            priority=None,
+            milestone=None,
+            sprint=False,
+            all=False,
+            sort='id',
+            assigned=None,
+            tags=None,
+            columns=None,
+            format='ids',
+        )
+
+        monkeypatch.chdir(tmp_path)
+        cmd_list(args)
+        assert capsys.readouterr().out == "TEST-01\nTEST-02\nTEST-03\n"
+
+        args.format = 'tsv'
+        args.columns = "id,status"
+        cmd_list(args)
+        assert capsys.readouterr().out == (
+            "ID\tStatus\nTEST-01\tbacklog\nTEST-02\tbacklog\nTEST-03\tbacklog\n"
+        )
+
 
 class TestCoreShowCommand:
     """Test cmd_show functionality."""
@@ -403,6 +403,9 @@ class TestHistoryCommand:
         assert "TEST-01" in output
         assert "TEST-02" in output
         assert "3" in output and "tasks" in output
+        # Each task block is its heading, its entries, then a blank line
+        assert "[TEST-00] Task 0\n" in output
+        assert output.endswith("\n\n")
 
 
 class TestStatsCommand:
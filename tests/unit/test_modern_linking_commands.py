@@ -52,3 +52,43 @@ def test_link_multiple_tasks(tmp_path, monkeypatch):
         assert "src/code.py" in task.references.code
         assert "tests/test_code.py" in task.references.tests
         assert task.verification.command == "pytest -q"
+
+
+def test_append_issues_matches_sequential_appends(tmp_path, monkeypatch):
+    """A batched append should write what one append per issue would."""
+    from datetime import datetime, timezone
+
+    from taskpy.modern.shared import tasks
+
+    fixed = datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    monkeypatch.setattr(tasks, "utc_now", lambda: fixed)
+
+    for original in (
+        "# Task\n\nBody\n",
+        "# Task\n\n## ISSUES\n\n- old\n\n## Notes\n\nText\n",
+        "# Task\n\n```\n## ISSUES\n```\n",
+    ):
+        batched = tmp_path / "batched.md"
+        sequential = tmp_path / "sequential.md"
+        batched.write_text(original)
+        sequential.write_text(original)
+
+        tasks.append_issues(batched, ["first", "second"])
+        tasks.append_issue(sequential, "first")
+        tasks.append_issue(sequential, "second")
+
+        assert batched.read_text() == sequential.read_text()
+
+
+def test_read_issues_ignores_fenced_and_missing_sections(tmp_path):
+    from taskpy.modern.shared.tasks import read_issues
+
+    path = tmp_path / "task.md"
+    path.write_text("# Task\n\nNo issues here\n")
+    assert read_issues(path) == []
+
+    path.write_text("# Task\n\n```\n## ISSUES\n- fenced\n```\n")
+    assert read_issues(path) == []
+
+    path.write_text("# Task\n\n## ISSUES\n\n- one\n- two\n\n## Notes\n\n- note\n")
+    assert read_issues(path) == ["- one", "- two"]
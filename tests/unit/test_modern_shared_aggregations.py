@@ -66,6 +66,10 @@ def test_project_stats():
     assert stats["total_tasks"] == 3
     assert stats["total_story_points"] == 6
     assert stats["by_status"]["done"] == 1
+    # Single-pass tallies agree with the individual helpers
+    assert stats["total_story_points"] == agg.sum_story_points(ROWS)
+    assert stats["by_status"] == agg.count_by_status(ROWS)
+    assert stats["by_priority"] == agg.count_by_priority(ROWS)
 
 
 def test_sprint_stats():
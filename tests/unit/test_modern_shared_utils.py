@@ -5,6 +5,7 @@ import pytest
 
 from taskpy.legacy.models import Task, TaskStatus, Priority, HistoryEntry, utc_now
 from taskpy.legacy.storage import TaskStorage
+from taskpy.modern.shared.tasks import find_task_file, load_task_from_path, task_file_index
 from taskpy.modern.shared.utils import (
     add_reason_argument,
     format_history_entry,
@@ -66,3 +67,45 @@ def test_add_reason_argument():
         parser.parse_args([])
     args = parser.parse_args(["--reason", "because"])
     assert args.reason == "because"
+
+
+def test_task_file_index_matches_find_task_file(tmp_path):
+    storage = _init_storage(tmp_path)
+    for number, status in enumerate((TaskStatus.BACKLOG, TaskStatus.ACTIVE, TaskStatus.DONE), 1):
+        storage.write_task_file(Task(
+            id=f"UTIL-0{number}",
+            epic="UTIL",
+            number=number,
+            title="Index test",
+            status=status,
+            priority=Priority.MEDIUM,
+            story_points=1,
+        ))
+
+    index = task_file_index(tmp_path)
+
+    assert sorted(index) == ["UTIL-01", "UTIL-02", "UTIL-03"]
+    for task_id in index:
+        assert index[task_id] == find_task_file(task_id, tmp_path)
+    assert find_task_file("UTIL-99", tmp_path, index) is None
+
+
+def test_load_task_from_path_parses_given_text(tmp_path):
+    storage = _init_storage(tmp_path)
+    storage.write_task_file(Task(
+        id="UTIL-01",
+        epic="UTIL",
+        number=1,
+        title="Read once",
+        status=TaskStatus.BACKLOG,
+        priority=Priority.MEDIUM,
+        story_points=1,
+    ))
+    path, _ = find_task_file("UTIL-01", tmp_path)
+    raw = path.read_text()
+    path.unlink()
+
+    task = load_task_from_path(path, raw)
+
+    assert task.id == "UTIL-01"
+    assert task.title == "Read once"
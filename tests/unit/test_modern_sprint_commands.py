@@ -24,6 +24,7 @@ from taskpy.modern.sprint.commands import (
     _load_sprint_metadata,
     _save_sprint_metadata,
 )
+from taskpy.modern.shared.tasks import load_manifest, write_task
 from taskpy.legacy.storage import TaskStorage
 from taskpy.legacy.models import Task, TaskStatus, Priority
 
@@ -205,6 +206,38 @@ class TestSprintAddCommand:
             path, _ = storage.find_task_file(tid)
             assert storage.read_task_file(path).in_sprint
 
+    def test_add_failure_keeps_manifest_for_written_tasks(self, tmp_path, monkeypatch):
+        """Tasks written before a failure should still get their manifest rows."""
+        storage = TaskStorage(tmp_path)
+        storage.initialize()
+
+        for i in range(2):
+            storage.write_task_file(Task(
+                id=f"TEST-0{i+1}",
+                epic="TEST",
+                number=i + 1,
+                title="Task",
+                status=TaskStatus.BACKLOG,
+                priority=Priority.MEDIUM,
+                story_points=1,
+            ))
+        storage.rebuild_manifest()
+
+        def fail_on_second(task, **kwargs):
+            if task.id == "TEST-02":
+                raise OSError("disk full")
+            write_task(task, **kwargs)
+
+        args = Namespace(task_ids=["TEST-01", "TEST-02"])
+        monkeypatch.chdir(tmp_path)
+        with patch('taskpy.modern.sprint.commands.write_task', side_effect=fail_on_second):
+            with pytest.raises(OSError):
+                _cmd_sprint_add(args)
+
+        rows = {row['id']: row for row in load_manifest(tmp_path)}
+        assert rows["TEST-01"]["in_sprint"] == "true"
+        assert rows["TEST-02"]["in_sprint"] == "false"
+
 
 class TestSprintRemoveCommand:
     """Test _cmd_sprint_remove functionality."""
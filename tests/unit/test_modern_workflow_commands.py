@@ -24,7 +24,7 @@ from taskpy.modern.workflow.commands import (
 )
 from taskpy.legacy.storage import TaskStorage
 from taskpy.legacy.models import Task, TaskStatus, Priority, VerificationStatus
-from taskpy.modern.shared.tasks import TaskRecord
+from taskpy.modern.shared.tasks import TaskRecord, load_manifest
 from taskpy.modern.shared.config import set_feature_flag, add_signoff_tickets
 
 
@@ -61,6 +61,11 @@ class TestHelperFunctions:
         result = parse_task_ids(["FEAT-01", "FEAT-01", "BUGS-02"])
         assert result == ["FEAT-01", "BUGS-02"]
 
+    def test_parse_task_ids_drops_blanks(self):
+        """Test that empty entries are dropped, with or without commas."""
+        result = parse_task_ids(["", "FEAT-01,,", " ", "feat-01, BUGS-02"])
+        assert result == ["FEAT-01", "BUGS-02"]
+
     def test_log_override(self, tmp_path, monkeypatch):
         """Test logging override to task history (REF-03)."""
         storage = TaskStorage(tmp_path)
@@ -90,6 +95,20 @@ class TestHelperFunctions:
         assert updated_task.history[0]["to_status"] == "qa"
         assert updated_task.history[0]["reason"] == "Testing override"
 
+    def test_log_override_reuses_loaded_task(self, tmp_path):
+        """A task the caller already loaded is updated without a file lookup."""
+        task = TaskRecord(
+            id="TEST-01", title="Test Task", epic="TEST", number=1,
+            status="active", priority="medium", story_points=2,
+        )
+
+        with patch("taskpy.modern.workflow.commands.find_task_file") as find_mock:
+            updated_task = log_override("TEST-01", "active", "qa", "Testing override", tmp_path, task)
+
+        find_mock.assert_not_called()
+        assert updated_task is task
+        assert task.history[-1]["action"] == "override"
+
 
 class TestValidationFunctions:
     """Test gate validation functions."""
@@ -232,6 +251,18 @@ class TestValidationFunctions:
         assert is_valid is False
         assert any("commit hash" in b for b in blockers)
 
+    def test_validate_promotion_commit_argument_leaves_task_untouched(self):
+        """A --commit hash satisfies the qa→done gate without being set on the task."""
+        task = TaskRecord(
+            id="TEST-01", title="Test task", epic="TEST", number=1,
+            status="qa", priority="medium", story_points=3,
+        )
+
+        is_valid, blockers = validate_promotion(task, "done", "abc123")
+        assert is_valid is True
+        assert blockers == []
+        assert task.commit_hash is None
+
     def test_validate_done_demotion_success(self):
         """Test successful done demotion validation."""
         task = Task(
@@ -729,6 +760,30 @@ class TestMoveCommand:
         updated_task = storage.read_task_file(path)
         assert updated_task.history[-1].reason == "Waiting on external dependency"
 
+    def test_move_warns_on_single_workflow_step(self, tmp_path, monkeypatch, capsys):
+        """Moving one step along the workflow suggests promote/demote instead."""
+        storage = TaskStorage(tmp_path)
+        storage.initialize()
+
+        for i, status in enumerate((TaskStatus.STUB, TaskStatus.READY), 1):
+            storage.write_task_file(Task(
+                id=f"TEST-0{i}",
+                epic="TEST",
+                number=i,
+                title=f"Test task {i}",
+                status=status,
+                priority=Priority.MEDIUM,
+                story_points=1
+            ))
+
+        monkeypatch.chdir(tmp_path)
+        cmd_move(Namespace(task_ids=["TEST-01", "TEST-02"], status="backlog", reason="Grooming"))
+
+        captured = capsys.readouterr()
+        output = captured.out + captured.err
+        assert "TEST-01: Use 'taskpy promote'" in output
+        assert "TEST-02: Use 'taskpy demote'" in output
+
     def test_move_multiple_tasks_space_separated(self, tmp_path, monkeypatch):
         """Test moving multiple tasks (space-separated)."""
         storage = TaskStorage(tmp_path)
@@ -762,6 +817,45 @@ class TestMoveCommand:
             path, status = result
             assert status == TaskStatus.BACKLOG
 
+        # The manifest is rewritten once for the batch and lists every move
+        statuses = {row["id"]: row["status"] for row in load_manifest(tmp_path)}
+        assert statuses == {"TEST-01": "backlog", "TEST-02": "backlog", "TEST-03": "backlog"}
+
+    def test_move_records_written_task_when_unlink_fails(self, tmp_path, monkeypatch):
+        """A task written to its new status keeps a manifest row if the old file lingers."""
+        storage = TaskStorage(tmp_path)
+        storage.initialize()
+
+        for i in range(1, 3):
+            storage.write_task_file(Task(
+                id=f"TEST-0{i}",
+                epic="TEST",
+                number=i,
+                title=f"Test task {i}",
+                status=TaskStatus.STUB,
+                priority=Priority.MEDIUM,
+                story_points=1
+            ))
+        storage.rebuild_manifest()
+
+        real_unlink = Path.unlink
+
+        def unlink(path, *a, **kw):
+            if path.name == "TEST-02.md":
+                raise PermissionError("read-only")
+            return real_unlink(path, *a, **kw)
+
+        args = Namespace(task_ids=["TEST-01", "TEST-02"], status="backlog", reason="Batch grooming")
+
+        monkeypatch.chdir(tmp_path)
+        with patch.object(Path, "unlink", unlink):
+            with pytest.raises(SystemExit) as excinfo:
+                cmd_move(args)
+
+        assert excinfo.value.code == 1
+        statuses = {row["id"]: row["status"] for row in load_manifest(tmp_path)}
+        assert statuses == {"TEST-01": "backlog", "TEST-02": "backlog"}
+
     def test_move_multiple_tasks_comma_separated(self, tmp_path, monkeypatch):
         """Test moving multiple tasks (comma-separated)."""
         storage = TaskStorage(tmp_path)
@@ -5,6 +5,7 @@ Unit tests for TaskPy storage layer.
 import pytest
 import tempfile
 import shutil
+import threading
 from pathlib import Path
 from taskpy.legacy.models import Task, TaskStatus, Priority
 from taskpy.legacy.storage import TaskStorage, StorageError, MANIFEST_HEADERS
@@ -198,3 +199,110 @@ class TestTaskStorage:
         manifest_rows = storage.manifest_file.read_text().splitlines()
         assert len(manifest_rows) == 2
         assert "FEAT-001" in manifest_rows[1]
+
+    def test_rebuild_manifest_bulk_replaces_rows(self, storage):
+        """Bulk rebuild should write exactly the given tasks, in order."""
+        storage.initialize()
+
+        stale = Task(id="BUGS-001", title="Stale", epic="BUGS", number=1)
+        storage.write_task_file(stale)
+
+        tasks = [
+            Task(id="FEAT-002", title="Second", epic="FEAT", number=2),
+            Task(id="FEAT-001", title="First", epic="FEAT", number=1),
+        ]
+
+        written = storage.rebuild_manifest_bulk(tasks)
+        assert written == 2
+
+        manifest_rows = storage.manifest_file.read_text().splitlines()
+        assert manifest_rows[0] == "\t".join(MANIFEST_HEADERS)
+        assert [row.split("\t")[0] for row in manifest_rows[1:]] == ["FEAT-002", "FEAT-001"]
+
+    def test_update_manifest_row_replaces_in_place(self, storage):
+        """Updating a task rewrites its own row without reordering others."""
+        storage.initialize()
+
+        first = Task(id="FEAT-001", title="First", epic="FEAT", number=1)
+        second = Task(id="FEAT-002", title="Second", epic="FEAT", number=2)
+        storage.write_task_file(first)
+        storage.write_task_file(second)
+
+        first.title = "First (edited)"
+        storage.write_task_file(first)
+
+        manifest_rows = storage.manifest_file.read_text().splitlines()
+        assert len(manifest_rows) == 3
+        assert manifest_rows[1] == storage.format_manifest_row(first).rstrip("\r\n")
+        assert manifest_rows[2].startswith("FEAT-002\t")
+
+    def test_read_task_frontmatter(self, storage):
+        """Frontmatter reads should return the metadata without the body."""
+        storage.initialize()
+
+        task = Task(id="FEAT-001", title="Frontmatter", epic="FEAT", number=1, auto_id=7)
+        task.content = "Body text\n" * 50
+        storage.write_task_file(task)
+        path = storage.get_task_path("FEAT-001", TaskStatus.BACKLOG)
+
+        metadata = storage.read_task_frontmatter(path)
+        assert metadata["id"] == "FEAT-001"
+        assert metadata["auto_id"] == 7
+
+    def test_read_task_frontmatter_crlf(self, storage):
+        """CRLF task files should parse like LF ones, as read_task_file() does."""
+        storage.initialize()
+
+        task = Task(id="FEAT-001", title="Windows", epic="FEAT", number=1, auto_id=3)
+        storage.write_task_file(task)
+        path = storage.get_task_path("FEAT-001", TaskStatus.BACKLOG)
+        path.write_bytes(path.read_bytes().replace(b"\n", b"\r\n"))
+
+        metadata = storage.read_task_frontmatter(path)
+        assert metadata["id"] == "FEAT-001"
+        assert metadata["auto_id"] == 3
+        assert storage.read_task_file(path).title == "Windows"
+
+    def test_rebuild_manifest_from_disk_reports_bad_files(self, storage):
+        """Unreadable task files go to on_error and are left out of the manifest."""
+        storage.initialize()
+
+        storage.write_task_file(Task(id="FEAT-002", title="Two", epic="FEAT", number=2))
+        storage.write_task_file(Task(id="FEAT-001", title="One", epic="FEAT", number=1))
+        bad_path = storage.status_dir / TaskStatus.BACKLOG.value / "BAD-01.md"
+        bad_path.write_text("no frontmatter here")
+
+        errors = []
+        added = []
+        count = storage.rebuild_manifest_from_disk(
+            on_error=lambda path, exc: errors.append(path), workers=4,
+            on_task=lambda task: added.append(task.id),
+        )
+
+        assert count == 2
+        assert errors == [bad_path]
+        assert added == ["FEAT-001", "FEAT-002"]
+        manifest_rows = storage.manifest_file.read_text().splitlines()
+        assert [row.split("\t")[0] for row in manifest_rows[1:]] == ["FEAT-001", "FEAT-002"]
+
+        with pytest.raises(StorageError):
+            storage.rebuild_manifest_from_disk()
+
+    def test_rebuild_manifest_reads_in_calling_thread(self, storage):
+        """The default rebuild reads files serially, without a thread pool."""
+        storage.initialize()
+
+        storage.write_task_file(Task(id="FEAT-001", title="One", epic="FEAT", number=1))
+        storage.write_task_file(Task(id="FEAT-002", title="Two", epic="FEAT", number=2))
+
+        read_task_file = storage.read_task_file
+        reader_threads = []
+
+        def recording_read(path):
+            reader_threads.append(threading.current_thread())
+            return read_task_file(path)
+
+        storage.read_task_file = recording_read
+
+        assert storage.rebuild_manifest() == 2
+        assert reader_threads == [threading.current_thread()] * 2